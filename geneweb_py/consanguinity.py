@@ -26,26 +26,40 @@ def _parents_of(storage, pid: str) -> List[str]:
     """Return a list of parent ids for pid (may be empty)."""
     parents = []
     try:
-        for fam in storage.families_of_person(pid):
-            # if pid appears as a child in this family, the husband/wife are parents
-            if pid in getattr(fam, "children_ids", []):
-                if getattr(fam, "husband_id", None):
-                    parents.append(fam.husband_id)
-                if getattr(fam, "wife_id", None):
-                    parents.append(fam.wife_id)
+        # the child-role index names the families where pid is a child, so
+        # there is no scan of each family's children list
+        for fam in storage.families_as_child(pid):
+            if fam.husband_id:
+                parents.append(fam.husband_id)
+            if fam.wife_id:
+                parents.append(fam.wife_id)
     except Exception:
         return []
-    # remove possible None and duplicates
-    return [p for i, p in enumerate(parents) if p and p not in parents[:i]]
+    # remove possible None and duplicates, keeping first-seen order
+    return list(dict.fromkeys(p for p in parents if p))
 
 
-def _ancestor_path_counts(storage, pid: str, max_depth: Optional[int]) -> Dict[str, Dict[int, int]]:
+def _memo_parents_of(storage, pid: str, memo: Dict[str, List[str]]) -> List[str]:
+    """`_parents_of` through a per-computation cache: the same ancestors are
+    reached at several depths, from both persons and from the recursive
+    inbreeding computations."""
+    parents = memo.get(pid)
+    if parents is None:
+        parents = memo[pid] = _parents_of(storage, pid)
+    return parents
+
+
+def _ancestor_path_counts(
+    storage, pid: str, max_depth: Optional[int], parents_memo: Optional[Dict[str, List[str]]] = None
+) -> Dict[str, Dict[int, int]]:
     """Count upward ancestor paths from pid.
 
     Returns a mapping ancestor_id -> {distance: count} where distance is the
     number of generations from ancestor -> pid. The mapping includes the pid
     itself at distance 0 with count 1.
     """
+    if parents_memo is None:
+        parents_memo = {}
     if max_depth is None:
         max_depth = 10  # sane default
 
@@ -59,7 +73,7 @@ def _ancestor_path_counts(storage, pid: str, max_depth: Optional[int]) -> Dict[s
             break
         next_level: Dict[str, int] = {}
         for node, ways in current.items():
-            parents = _parents_of(storage, node)
+            parents = _memo_parents_of(storage, node, parents_memo)
             for p in parents:
                 # increment the number of distinct upward paths reaching p at depth+1
                 counts[p][depth + 1] += ways
@@ -76,6 +90,12 @@ def relationship_and_links(storage, a_id: str, b_id: str, max_anc_depth: Optiona
     describing for each ancestor: ancestor_id, n1_counts, n2_counts,
     contribution, ancestor_inbreeding.
     """
+    return _relationship_and_links(storage, a_id, b_id, max_anc_depth, {})
+
+
+def _relationship_and_links(
+    storage, a_id: str, b_id: str, max_anc_depth: Optional[int], parents_memo: Dict[str, List[str]]
+) -> Tuple[float, List[dict]]:
     # Quick validation
     if a_id is None or b_id is None:
         return 0.0, []
@@ -83,8 +103,8 @@ def relationship_and_links(storage, a_id: str, b_id: str, max_anc_depth: Optiona
         return 0.0, []
 
     # Precompute ancestor path counts (including self at distance 0)
-    a_counts = _ancestor_path_counts(storage, a_id, max_anc_depth)
-    b_counts = _ancestor_path_counts(storage, b_id, max_anc_depth)
+    a_counts = _ancestor_path_counts(storage, a_id, max_anc_depth, parents_memo)
+    b_counts = _ancestor_path_counts(storage, b_id, max_anc_depth, parents_memo)
 
     # Memoization for inbreeding coefficients
     f_memo: Dict[str, float] = {}
@@ -98,10 +118,10 @@ def relationship_and_links(storage, a_id: str, b_id: str, max_anc_depth: Optiona
             # cycle detection: defensively treat as 0 while computing
             return 0.0
         computing.add(person_id)
-        parents = _parents_of(storage, person_id)
+        parents = _memo_parents_of(storage, person_id, parents_memo)
         if len(parents) >= 2:
             # relationship between parents approximates F(child)
-            r_parents, _ = relationship_and_links(storage, parents[0], parents[1], max_anc_depth)
+            r_parents, _ = _relationship_and_links(storage, parents[0], parents[1], max_anc_depth, parents_memo)
             F = r_parents
         else:
             F = 0.0
@@ -109,17 +129,19 @@ def relationship_and_links(storage, a_id: str, b_id: str, max_anc_depth: Optiona
         computing.remove(person_id)
         return F
 
-    # Find common ancestors
-    common = set(a_counts.keys()) & set(b_counts.keys())
+    # Find common ancestors: walk the smaller count map and probe the larger
+    # one, so the cost follows the closer person's ancestry
+    small, large = (a_counts, b_counts) if len(a_counts) <= len(b_counts) else (b_counts, a_counts)
+    common = sorted(anc for anc in small if anc in large)
     if not common:
         return 0.0, []
 
     total_r = 0.0
     common_list: List[dict] = []
-    for anc in sorted(common):
-        # build depth->count dictionaries
-        n1_counts = dict(a_counts.get(anc, {}))
-        n2_counts = dict(b_counts.get(anc, {}))
+    for anc in common:
+        # build depth->count dictionaries; anc is in both maps
+        n1_counts = dict(a_counts[anc])
+        n2_counts = dict(b_counts[anc])
         Fanc = _inbreeding(anc)
         contrib = 0.0
         for n1, c1 in n1_counts.items():
@@ -10,10 +10,20 @@ library, this module can be extended to add an alternate code-path.
 """
 from __future__ import annotations
 from pathlib import Path
-from typing import Dict, Any, List, Tuple, Optional
-from .storage import Storage
+from typing import TYPE_CHECKING, Dict, Any, Iterator, List, Tuple, Optional
 from .models import Person, Family, CDate, Place, PersEvent
 import re
+import sys
+
+if TYPE_CHECKING:
+    # only needed for annotations: the caller hands in a Storage instance, so
+    # importing this module does not have to load the sqlite-backed layer
+    from .storage import Storage
+
+
+# GEDCOM SEX value -> the model's single-letter code; one dict lookup per
+# person and every person shares these constant strings
+_SEX_CODES = {"M": "M", "F": "F", "N": "N", "m": "M", "f": "F", "n": "N"}
 
 
 def _normalize_gedcom_id(raw: str) -> str:
@@ -34,12 +44,13 @@ def _split_name(name: str) -> Tuple[str, str]:
     # GEDCOM names are often like 'Given /Surname/'
     if not name:
         return "", ""
-    # extract surname between slashes
-    m = re.match(r"(.*?)/([^/]+)/(.*)", name)
-    if m:
-        given = (m.group(1) + " " + m.group(3)).strip()
-        surname = m.group(2).strip()
-        return given, surname
+    # extract surname between slashes: the first non-empty '/.../' segment
+    # that has a closing slash, using split() instead of a regex per person
+    parts = name.split("/")
+    for k in range(1, len(parts) - 1):
+        if parts[k]:
+            given = ("/".join(parts[:k]) + " " + "/".join(parts[k + 1:])).strip()
+            return given, parts[k].strip()
     # fallback: split last token as surname
     parts = name.strip().split()
     if len(parts) == 1:
@@ -57,15 +68,18 @@ def _parse_gedcom(path: Path) -> Dict[str, Dict[str, Any]]:
     cur_type: Optional[str] = None
     # store children as list of (level, tag, value)
 
-    with path.open("r", encoding="utf-8", errors="replace") as f:
+    # large read buffer: GEDCOM files are read start to end in one go
+    with path.open("r", encoding="utf-8", errors="replace", buffering=1 << 20) as f:
         for raw in f:
             line = raw.rstrip("\r\n")
             if not line:
                 continue
-            parts = line.split(" ", 2)
-            if len(parts) == 1:
+            # "<level> <tag or @id@> [<value>]": partition() returns fixed
+            # 3-tuples instead of building a list per line like split()
+            level, sep, rest = line.partition(" ")
+            if not sep:
                 continue
-            level = parts[0]
+            first, _, value = rest.partition(" ")
             # level may be '0'..'n'
             try:
                 lvl = int(level)
@@ -74,9 +88,9 @@ def _parse_gedcom(path: Path) -> Dict[str, Dict[str, Any]]:
             # Determine if the second token is an id (like @I1@) or a tag
             if lvl == 0:
                 # new record or standalone tag
-                if len(parts) == 3 and parts[1].startswith("@") and parts[2]:
-                    rid = _normalize_gedcom_id(parts[1])
-                    rtype = parts[2].strip()
+                if first.startswith("@") and value:
+                    rid = _normalize_gedcom_id(first)
+                    rtype = sys.intern(value.strip())
                     cur_id = rid
                     cur_type = rtype
                     records[cur_id] = {"type": cur_type, "tags": {}}
@@ -88,12 +102,11 @@ def _parse_gedcom(path: Path) -> Dict[str, Dict[str, Any]]:
             # non-zero levels: attribute lines belong to the current record
             if cur_id is None:
                 continue
-            # parse tag and value
-            if len(parts) >= 2:
-                tag = parts[1].strip()
-                value = parts[2].strip() if len(parts) == 3 else ""
-                tags = records[cur_id]["tags"]
-                tags.setdefault(tag, []).append(value)
+            # parse tag and value; the same few tags repeat on every record,
+            # so share one string object per tag name
+            tag = sys.intern(first.strip())
+            tags = records[cur_id]["tags"]
+            tags.setdefault(tag, []).append(value.strip())
     return records
 
 
@@ -104,125 +117,171 @@ def import_gedcom(file_path: str | Path, storage: Storage) -> Dict[str, str]:
     """
     p = Path(file_path)
     recs = _parse_gedcom(p)
-    # First pass: create persons for INDI
-    id_map: Dict[str, str] = {}
+    # split records by type in a single pass so each import pass below walks
+    # only its own records instead of filtering the whole file again
+    indis: List[Tuple[str, Dict[str, Any]]] = []
+    fams: List[Tuple[str, Dict[str, Any]]] = []
     for gid, rec in recs.items():
-        if rec.get("type") != "INDI":
-            continue
-        tags = rec.get("tags", {})
-        name_vals = tags.get("NAME", [])
-        given, surname = ("", "")
-        if name_vals:
-            given, surname = _split_name(name_vals[0])
-        sex = tags.get("SEX", [None])[0]
-        # birth/death
-        birth = None
-        death = None
-        # GEDCOM often uses BIRT/DEAT as tags with child DATE and PLAC lines; our simple parser keeps them as flat tags like 'DATE' entries following BIRT
-        # We'll look for lines 'BIRT' and then 'DATE' in subsequent tags; as a simple heuristic, try tags 'BIRT' 'DATE' or 'DATE' with context missing.
-        # Look for tags with keys like 'DATE' and 'PLAC' and hope they refer to birth/death; if both exist we prefer birth if BIRT present.
-        if "BIRT" in tags:
-            date = tags.get("DATE", [None])[0]
-            place = tags.get("PLAC", [None])[0]
-            birth = PersEvent(kind="birth", date=CDate.from_string(date), place=Place.from_simple(place), note=None)
-        if "DEAT" in tags or "DEATH" in tags:
-            date = tags.get("DATE", [None])[0]
-            place = tags.get("PLAC", [None])[0]
-            death = PersEvent(kind="death", date=CDate.from_string(date), place=Place.from_simple(place), note=None)
-        # Create person with gedcom-prefixed id for traceability
-        person_id = gid
-        # map sex to single-letter code if available
-        sex_code = sex if sex in ("M", "F", "N") else (sex and sex.strip())
-        # create Person using structured fields
-        person = Person(id=person_id, first_name=given, surname=surname, sex=sex_code)
-        if birth:
-            person.pevents.append(birth)
-            # also set birth_date/place for convenience
-            person.birth_date = birth.date
-            person.birth_place = birth.place
-        if death:
-            person.pevents.append(death)
-            person.death_date = death.date
-            person.death_place = death.place
-        storage.add_person(person)
-        id_map[gid] = person.id
-    # Second pass: create families
-    for gid, rec in recs.items():
-        if rec.get("type") != "FAM":
-            continue
-        tags = rec.get("tags", {})
-        husb = tags.get("HUSB", [None])[0]
-        wife = tags.get("WIFE", [None])[0]
-        chil = tags.get("CHIL", [])
-        husb_id = _normalize_gedcom_id(husb) if husb else None
-        wife_id = _normalize_gedcom_id(wife) if wife else None
-        children_ids = [_normalize_gedcom_id(c) for c in chil]
-        # Create Family with gedcom ids (they should map to person ids created earlier)
-        fa = Family(id=gid, husband_id=husb_id, wife_id=wife_id, children_ids=children_ids)
-        # ensure referenced persons exist; if not, create placeholder persons
-        for pid in [husb_id, wife_id] + children_ids:
-            if not pid:
-                continue
-            if storage.get_person(pid) is None:
-                # placeholder
-                storage.add_person(Person(id=pid, first_name="", surname=""))
-        storage.add_family(fa)
+        rtype = rec.get("type")
+        if rtype == "INDI":
+            indis.append((gid, rec))
+        elif rtype == "FAM":
+            fams.append((gid, rec))
+    id_map: Dict[str, str] = {}
+    # one transaction for the whole file instead of a commit per record;
+    # records are collected and handed to storage in bulk
+    with storage.batch():
+        # First pass: create persons for INDI
+        persons: List[Person] = []
+        for gid, rec in indis:
+            tags = rec.get("tags", {})
+            name_vals = tags.get("NAME", [])
+            given, surname = ("", "")
+            if name_vals:
+                given, surname = _split_name(name_vals[0])
+                # surnames repeat across a file: keep one copy per distinct name
+                surname = sys.intern(surname)
+            sex = tags.get("SEX", [None])[0]
+            # birth/death
+            birth = None
+            death = None
+            # GEDCOM often uses BIRT/DEAT as tags with child DATE and PLAC lines; our simple parser keeps them as flat tags like 'DATE' entries following BIRT
+            # We'll look for lines 'BIRT' and then 'DATE' in subsequent tags; as a simple heuristic, try tags 'BIRT' 'DATE' or 'DATE' with context missing.
+            # Look for tags with keys like 'DATE' and 'PLAC' and hope they refer to birth/death; if both exist we prefer birth if BIRT present.
+            if "BIRT" in tags:
+                date = tags.get("DATE", [None])[0]
+                place = tags.get("PLAC", [None])[0]
+                birth = PersEvent(kind="birth", date=CDate.from_string(date), place=Place.from_simple(place), note=None)
+            if "DEAT" in tags or "DEATH" in tags:
+                date = tags.get("DATE", [None])[0]
+                place = tags.get("PLAC", [None])[0]
+                death = PersEvent(kind="death", date=CDate.from_string(date), place=Place.from_simple(place), note=None)
+            # Create person with gedcom-prefixed id for traceability
+            person_id = gid
+            # map sex to single-letter code if available; other values are
+            # kept as written (the parser already stripped them)
+            sex_code = _SEX_CODES.get(sex, sex)
+            # create Person using structured fields
+            person = Person(id=person_id, first_name=given, surname=surname, sex=sex_code)
+            if birth:
+                person.pevents.append(birth)
+                # also set birth_date/place for convenience
+                person.birth_date = birth.date
+                person.birth_place = birth.place
+            if death:
+                person.pevents.append(death)
+                person.death_date = death.date
+                person.death_place = death.place
+            persons.append(person)
+            id_map[gid] = person.id
+        storage.add_persons(persons)
+        # Second pass: create families
+        families: List[Family] = []
+        placeholders: Dict[str, Person] = {}
+        for gid, rec in fams:
+            tags = rec.get("tags", {})
+            husb = tags.get("HUSB", [None])[0]
+            wife = tags.get("WIFE", [None])[0]
+            chil = tags.get("CHIL", [])
+            husb_id = _normalize_gedcom_id(husb) if husb else None
+            wife_id = _normalize_gedcom_id(wife) if wife else None
+            children_ids = [_normalize_gedcom_id(c) for c in chil]
+            # Create Family with gedcom ids (they should map to person ids created earlier)
+            fa = Family(id=gid, husband_id=husb_id, wife_id=wife_id, children_ids=children_ids)
+            # ensure referenced persons exist; if not, create placeholder persons
+            for pid in [husb_id, wife_id] + children_ids:
+                if not pid:
+                    continue
+                if pid not in placeholders and storage.get_person(pid) is None:
+                    # placeholder
+                    placeholders[pid] = Person(id=pid, first_name="", surname="")
+            families.append(fa)
+        storage.add_persons(placeholders.values())
+        storage.add_families(families)
     return id_map
 
 
-def export_gedcom(storage: Storage, out_path: str | Path) -> None:
-    """Export current storage content to a simple GEDCOM file.
+# lines buffered by export_gedcom before they are written out
+_EXPORT_CHUNK_LINES = 8192
+# fixed records opening and closing every exported file
+_GEDCOM_HEADER = "0 HEAD"
+_GEDCOM_TRAILER = "0 TRLR"
 
-    This is a conservative exporter: creates INDI records for persons and FAM
-    records for families with minimal tags (NAME, SEX, BIRT/DEAT DATE/PLAC).
+
+def _iter_gedcom_chunks(storage: Storage) -> Iterator[str]:
+    """Yield the GEDCOM text for `storage` in chunks of whole records.
+
+    Concatenating the chunks gives the complete file; each chunk holds
+    about `_EXPORT_CHUNK_LINES` lines so callers never need the whole
+    export in memory at once.
     """
-    out = Path(out_path)
     lines: List[str] = []
-    # header
-    lines.append("0 HEAD")
-    # persons
-    for p in storage.list_persons():
-        gid = p.id
-        lines.append(f"0 @{gid}@ INDI")
+    append = lines.append
+    append(_GEDCOM_HEADER)
+    # persons: every field is read once per record into a local
+    for p in storage.persons.values():
+        if len(lines) >= _EXPORT_CHUNK_LINES:
+            yield "\n".join(lines) + "\n"
+            lines.clear()
         name = f"{p.first_name} /{p.surname}/".strip()
-        lines.append(f"1 NAME {name}")
-        if p.sex:
-            lines.append(f"1 SEX {p.sex}")
-        if p.birth_date or p.birth_place:
-            lines.append("1 BIRT")
-            if p.birth_date:
-                d = p.birth_date.to_iso() if hasattr(p.birth_date, "to_iso") else None
-                if d:
-                    lines.append(f"2 DATE {d}")
-            if p.birth_place:
-                sp = p.birth_place.to_simple() if hasattr(p.birth_place, "to_simple") else None
-                if sp:
-                    lines.append(f"2 PLAC {sp}")
-        if p.death_date or p.death_place:
-            lines.append("1 DEAT")
-            if p.death_date:
-                d = p.death_date.to_iso() if hasattr(p.death_date, "to_iso") else None
-                if d:
-                    lines.append(f"2 DATE {d}")
-            if p.death_place:
-                sp = p.death_place.to_simple() if hasattr(p.death_place, "to_simple") else None
-                if sp:
-                    lines.append(f"2 PLAC {sp}")
+        append(f"0 @{p.id}@ INDI\n1 NAME {name}")
+        sex = p.sex
+        if sex:
+            append(f"1 SEX {sex}")
+        date, place = p.birth_date, p.birth_place
+        if date or place:
+            append("1 BIRT")
+            d = date.to_iso() if date else None
+            if d:
+                append(f"2 DATE {d}")
+            sp = place.to_simple() if place else None
+            if sp:
+                append(f"2 PLAC {sp}")
+        date, place = p.death_date, p.death_place
+        if date or place:
+            append("1 DEAT")
+            d = date.to_iso() if date else None
+            if d:
+                append(f"2 DATE {d}")
+            sp = place.to_simple() if place else None
+            if sp:
+                append(f"2 PLAC {sp}")
     # families
     for f in storage.families.values():
-        gid = f.id
-        lines.append(f"0 @{gid}@ FAM")
-        if f.husband_id:
-            lines.append(f"1 HUSB @{f.husband_id}@")
-        if f.wife_id:
-            lines.append(f"1 WIFE @{f.wife_id}@")
+        if len(lines) >= _EXPORT_CHUNK_LINES:
+            yield "\n".join(lines) + "\n"
+            lines.clear()
+        append(f"0 @{f.id}@ FAM")
+        husband_id, wife_id = f.husband_id, f.wife_id
+        if husband_id:
+            append(f"1 HUSB @{husband_id}@")
+        if wife_id:
+            append(f"1 WIFE @{wife_id}@")
         for c in f.children_ids:
-            lines.append(f"1 CHIL @{c}@")
-    lines.append("0 TRLR")
+            append(f"1 CHIL @{c}@")
+    append(_GEDCOM_TRAILER)
+    yield "\n".join(lines)
+
+
+def export_gedcom(storage: Storage, out_path: str | Path) -> None:
+    """Export current storage content to a simple GEDCOM file.
+
+    This is a conservative exporter: creates INDI records for persons and FAM
+    records for families with minimal tags (NAME, SEX, BIRT/DEAT DATE/PLAC).
+    """
+    out = Path(out_path)
     # Ensure parent directory exists
     if not out.parent.exists():
         out.parent.mkdir(parents=True, exist_ok=True)
-    out.write_text("\n".join(lines), encoding="utf-8")
+    # stream the chunks through a large buffer instead of building the
+    # whole file in memory first
+    with out.open("w", encoding="utf-8", buffering=1 << 20) as fh:
+        fh.writelines(_iter_gedcom_chunks(storage))
+
+
+def export_gedcom_to_string(storage: Storage) -> str:
+    """Return the GEDCOM text `export_gedcom` would write for `storage`."""
+    return "".join(_iter_gedcom_chunks(storage))
 
 
 if __name__ == "__main__":
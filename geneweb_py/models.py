@@ -1,14 +1,43 @@
 from __future__ import annotations
 from dataclasses import dataclass, field, asdict
 from typing import List, Optional, Dict, Any
+from functools import lru_cache
+import re
 import uuid
 
+# ISO formats: YYYY or YYYY-MM or YYYY-MM-DD
+_ISO_DATE_RE = re.compile(r"^(\d{3,4})(?:-(\d{1,2})(?:-(\d{1,2}))?)?$")
+# GEDCOM-style forms, tried in this order by CDate.from_string()
+_MONTH_DATE_RE = re.compile(r"^(?:(\d{1,2})\s+)?([A-Z]{3,9})\.?,?\s+(\d{3,4})$")
+_APPROX_DATE_RE = re.compile(r"^(ABT|ABOUT|EST|CA|CIRCA)\.?\s+(\d{3,4})$")
+_BETWEEN_DATE_RE = re.compile(r"^(BET|BETWEEN)\s+(\d{3,4})\s+AND\s+(\d{3,4})$")
+_FROM_TO_DATE_RE = re.compile(r"^FROM\s+(\d{3,4})\s+TO\s+(\d{3,4})$")
+_BEFORE_DATE_RE = re.compile(r"^(BEF|BEFORE)\s+(\d{3,4})$")
+_AFTER_DATE_RE = re.compile(r"^(AFT|AFTER)\s+(\d{3,4})$")
+_ANY_YEAR_RE = re.compile(r"(\d{3,4})")
+
+# Month name (first three letters) -> month number
+_MONTHS = {
+    "JAN": 1,
+    "FEB": 2,
+    "MAR": 3,
+    "APR": 4,
+    "MAY": 5,
+    "JUN": 6,
+    "JUL": 7,
+    "AUG": 8,
+    "SEP": 9,
+    "OCT": 10,
+    "NOV": 11,
+    "DEC": 12,
+}
+
 
 def _new_id() -> str:
     return str(uuid.uuid4())
 
 
-@dataclass
+@dataclass(slots=True)
 class CDate:
     year: Optional[int] = None
     month: Optional[int] = None
@@ -34,94 +63,117 @@ class CDate:
         return f"{self.year:04d}-{self.month:02d}-{self.day:02d}"
 
     @staticmethod
-    def from_string(s: Optional[str]) -> Optional["CDate"]:
+    def from_iso(s: Optional[str]) -> Optional["CDate"]:
+        """Parse a value written by `to_iso()` ('YYYY', 'YYYY-MM' or
+        'YYYY-MM-DD'). Anything else, including years that are not four
+        digits long, goes through `from_string()`."""
         if not s:
             return None
-        raw = s.strip()
-        if not raw:
+        parts = s.split("-")
+        if (
+            len(parts) > 3
+            or len(parts[0]) != 4
+            or not all(1 <= len(x) <= 2 for x in parts[1:])
+            or not all(x.isdecimal() for x in parts)
+        ):
+            return CDate.from_string(s)
+        year = int(parts[0])
+        month = int(parts[1]) if len(parts) > 1 else None
+        day = int(parts[2]) if len(parts) > 2 else None
+        precision = "day" if day else "month" if month else "year"
+        return CDate(year=year, month=month, day=day, precision=precision)
+
+    @staticmethod
+    def from_string(s: Optional[str]) -> Optional["CDate"]:
+        if not s:
             return None
-        txt = raw.upper().strip()
-        # ISO formats: YYYY or YYYY-MM or YYYY-MM-DD
-        import re
-
-        iso_match = re.match(r"^(\d{3,4})(?:-(\d{1,2})(?:-(\d{1,2}))?)?$", txt)
-        if iso_match:
-            year = int(iso_match.group(1))
-            month = int(iso_match.group(2)) if iso_match.group(2) else None
-            day = int(iso_match.group(3)) if iso_match.group(3) else None
+        cd = _parse_cdate(s)
+        # the cache shares one instance per input text; CDate is mutable, so
+        # each caller gets its own copy
+        return CDate(cd.year, cd.month, cd.day, cd.precision) if cd else None
+
+
+# Dates repeat heavily across a base (siblings, GEDCOM imports, reloads):
+# keep the parsed result per input string instead of re-running the regexes.
+@lru_cache(maxsize=65536)
+def _parse_cdate(s: str) -> Optional[CDate]:
+    raw = s.strip()
+    if not raw:
+        return None
+    txt = raw.upper().strip()
+    # Fast path for the full 'YYYY-MM-DD' form (what to_iso() writes and
+    # what the storage layer reads back): slice instead of running a regex.
+    if len(txt) == 10 and txt[4] == "-" and txt[7] == "-":
+        y, mo, d = txt[:4], txt[5:7], txt[8:]
+        if y.isdecimal() and mo.isdecimal() and d.isdecimal():
+            day = int(d)
+            month = int(mo)
             precision = "day" if day else "month" if month else "year"
+            return CDate(year=int(y), month=month, day=day, precision=precision)
+
+    iso_match = _ISO_DATE_RE.match(txt)
+    if iso_match:
+        year = int(iso_match.group(1))
+        month = int(iso_match.group(2)) if iso_match.group(2) else None
+        day = int(iso_match.group(3)) if iso_match.group(3) else None
+        precision = "day" if day else "month" if month else "year"
+        return CDate(year=year, month=month, day=day, precision=precision)
+
+    # Month name formats like '12 JAN 1900' or 'JAN 1900'
+    m = _MONTH_DATE_RE.match(txt)
+    if m:
+        day = int(m.group(1)) if m.group(1) else None
+        mon_txt = m.group(2)[:3]
+        month = _MONTHS.get(mon_txt)
+        # only accept this match if the token is a valid month name
+        if month:
+            year = int(m.group(3))
+            precision = "day" if day else "month"
             return CDate(year=year, month=month, day=day, precision=precision)
 
-        # Month name formats like '12 JAN 1900' or 'JAN 1900'
-        months = {
-            "JAN": 1,
-            "FEB": 2,
-            "MAR": 3,
-            "APR": 4,
-            "MAY": 5,
-            "JUN": 6,
-            "JUL": 7,
-            "AUG": 8,
-            "SEP": 9,
-            "SEPT": 9,
-            "OCT": 10,
-            "NOV": 11,
-            "DEC": 12,
-        }
-        m = re.match(r"^(?:(\d{1,2})\s+)?([A-Z]{3,9})\.?,?\s+(\d{3,4})$", txt)
-        if m:
-            day = int(m.group(1)) if m.group(1) else None
-            mon_txt = m.group(2)[:3]
-            month = months.get(mon_txt)
-            # only accept this match if the token is a valid month name
-            if month:
-                year = int(m.group(3))
-                precision = "day" if day else "month"
-                return CDate(year=year, month=month, day=day, precision=precision)
-
-        # GEDCOM qualifiers: ABT/ABOUT/EST/CA -> approximate
-        m = re.match(r"^(ABT|ABOUT|EST|CA|CIRCA)\.?\s+(\d{3,4})$", txt)
-        if m:
-            year = int(m.group(2))
-            return CDate(year=year, month=None, day=None, precision="approx")
-
-        # BETWEEN x AND y  or BET x AND y
-        m = re.match(r"^(BET|BETWEEN)\s+(\d{3,4})\s+AND\s+(\d{3,4})$", txt)
-        if m:
-            lo = int(m.group(2))
-            hi = int(m.group(3))
-            # store lower bound and mark as range
-            return CDate(year=lo, month=None, day=None, precision=f"between_{hi}")
-
-        # FROM x TO y
-        m = re.match(r"^FROM\s+(\d{3,4})\s+TO\s+(\d{3,4})$", txt)
-        if m:
-            lo = int(m.group(1))
-            hi = int(m.group(2))
-            return CDate(year=lo, month=None, day=None, precision=f"range_{hi}")
-
-        # BEFORE / BEF
-        m = re.match(r"^(BEF|BEFORE)\s+(\d{3,4})$", txt)
-        if m:
-            year = int(m.group(2))
-            return CDate(year=year, precision="before")
-
-        # AFTER / AFT
-        m = re.match(r"^(AFT|AFTER)\s+(\d{3,4})$", txt)
-        if m:
-            year = int(m.group(2))
-            return CDate(year=year, precision="after")
-
-        # Fallback: find first 3-4 digit year in string
-        m = re.search(r"(\d{3,4})", txt)
-        if m:
-            year = int(m.group(1))
-            return CDate(year=year, precision="unknown")
-
-        return None
-
-
-@dataclass
+    # GEDCOM qualifiers: ABT/ABOUT/EST/CA -> approximate
+    m = _APPROX_DATE_RE.match(txt)
+    if m:
+        year = int(m.group(2))
+        return CDate(year=year, month=None, day=None, precision="approx")
+
+    # BETWEEN x AND y  or BET x AND y
+    m = _BETWEEN_DATE_RE.match(txt)
+    if m:
+        lo = int(m.group(2))
+        hi = int(m.group(3))
+        # store lower bound and mark as range
+        return CDate(year=lo, month=None, day=None, precision=f"between_{hi}")
+
+    # FROM x TO y
+    m = _FROM_TO_DATE_RE.match(txt)
+    if m:
+        lo = int(m.group(1))
+        hi = int(m.group(2))
+        return CDate(year=lo, month=None, day=None, precision=f"range_{hi}")
+
+    # BEFORE / BEF
+    m = _BEFORE_DATE_RE.match(txt)
+    if m:
+        year = int(m.group(2))
+        return CDate(year=year, precision="before")
+
+    # AFTER / AFT
+    m = _AFTER_DATE_RE.match(txt)
+    if m:
+        year = int(m.group(2))
+        return CDate(year=year, precision="after")
+
+    # Fallback: find first 3-4 digit year in string
+    m = _ANY_YEAR_RE.search(txt)
+    if m:
+        year = int(m.group(1))
+        return CDate(year=year, precision="unknown")
+
+    return None
+
+
+@dataclass(slots=True)
 class Place:
     town: Optional[str] = None
     county: Optional[str] = None
@@ -152,7 +204,7 @@ class Place:
         return Place(other=s, town=s)
 
 
-@dataclass
+@dataclass(slots=True)
 class PersEvent:
     kind: str
     date: Optional[CDate] = None
@@ -167,7 +219,7 @@ class PersEvent:
         return PersEvent(kind=d.get("kind", ""), date=CDate.from_dict(d.get("date")), place=Place.from_dict(d.get("place")), note=d.get("note"))
 
 
-@dataclass
+@dataclass(slots=True)
 class Family:
     id: str = field(default_factory=_new_id)
     husband_id: Optional[str] = None
@@ -181,10 +233,24 @@ class Family:
     @staticmethod
     def from_dict(d: Dict[str, Any]) -> "Family":
         evs = [PersEvent.from_dict(e) for e in d.get("fevents", [])]
-        return Family(id=d.get("id", _new_id()), husband_id=d.get("husband_id"), wife_id=d.get("wife_id"), children_ids=d.get("children_ids", []), fevents=evs)
+        return Family(id=d["id"] if "id" in d else _new_id(), husband_id=d.get("husband_id"), wife_id=d.get("wife_id"), children_ids=d.get("children_ids", []), fevents=evs)
+
+
+def _as_cdate(v: Any) -> Optional[CDate]:
+    """Coerce a stored date (dict or CDate) to a CDate; anything else is None."""
+    if isinstance(v, dict):
+        return CDate.from_dict(v)
+    return v if isinstance(v, CDate) else None
+
+
+def _as_place(v: Any) -> Optional[Place]:
+    """Coerce a stored place (dict or Place) to a Place; anything else is None."""
+    if isinstance(v, dict):
+        return Place.from_dict(v)
+    return v if isinstance(v, Place) else None
 
 
-@dataclass
+@dataclass(slots=True)
 class Person:
     id: str = field(default_factory=_new_id)
     first_name: str = ""
@@ -218,25 +284,23 @@ class Person:
 
     @staticmethod
     def from_dict(d: Dict[str, Any]) -> "Person":
-        bd = d.get("birth_date")
-        dp = d.get("death_date")
         return Person(
-            id=d.get("id", _new_id()),
+            id=d["id"] if "id" in d else _new_id(),
             first_name=d.get("first_name", ""),
             surname=d.get("surname", ""),
             sex=d.get("sex"),
-            birth_date=CDate.from_dict(bd) if isinstance(bd, dict) else (bd if isinstance(bd, CDate) else None),
-            birth_place=Place.from_dict(d.get("birth_place")) if isinstance(d.get("birth_place"), dict) else (d.get("birth_place") if isinstance(d.get("birth_place"), Place) else None),
+            birth_date=_as_cdate(d.get("birth_date")),
+            birth_place=_as_place(d.get("birth_place")),
             birth_note=d.get("birth_note"),
-            death_date=CDate.from_dict(dp) if isinstance(dp, dict) else (dp if isinstance(dp, CDate) else None),
-            death_place=Place.from_dict(d.get("death_place")) if isinstance(d.get("death_place"), dict) else (d.get("death_place") if isinstance(d.get("death_place"), Place) else None),
+            death_date=_as_cdate(d.get("death_date")),
+            death_place=_as_place(d.get("death_place")),
             death_note=d.get("death_note"),
             pevents=[PersEvent.from_dict(e) for e in d.get("pevents", [])],
             notes=d.get("notes", []),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Note:
     id: str = field(default_factory=_new_id)
     title: str = ""
@@ -247,4 +311,4 @@ class Note:
 
     @staticmethod
     def from_dict(d: Dict[str, Any]) -> "Note":
-        return Note(id=d.get("id", _new_id()), title=d.get("title", ""), text=d.get("text", ""))
+        return Note(id=d["id"] if "id" in d else _new_id(), title=d.get("title", ""), text=d.get("text", ""))
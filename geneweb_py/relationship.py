@@ -19,28 +19,26 @@ from typing import List, Dict, Set, Tuple, Optional
 def _neighbors(storage, pid: str) -> Set[str]:
     """Return set of neighboring person ids (parents, children, spouses)."""
     nbors: Set[str] = set()
+    # The role indexes hand over only the families where pid is a child
+    # (parents) or a spouse (partner and children), so no per-family
+    # membership tests on children_ids are needed.
     try:
-        fams = list(storage.families_of_person(pid))
+        child_fams = list(storage.families_as_child(pid))
+        spouse_fams = list(storage.families_as_spouse(pid))
     except Exception:
-        fams = []
-    for fam in fams:
-        # parents: if pid is a child in this family, add husband and wife
-        if pid in getattr(fam, "children_ids", []):
-            if fam.husband_id:
-                nbors.add(fam.husband_id)
-            if fam.wife_id:
-                nbors.add(fam.wife_id)
-        # spouses and children
-        if fam.husband_id == pid:
-            if fam.wife_id:
-                nbors.add(fam.wife_id)
-            for c in getattr(fam, "children_ids", []):
-                nbors.add(c)
-        if fam.wife_id == pid:
-            if fam.husband_id:
-                nbors.add(fam.husband_id)
-            for c in getattr(fam, "children_ids", []):
-                nbors.add(c)
+        child_fams, spouse_fams = [], []
+    for fam in child_fams:
+        if fam.husband_id:
+            nbors.add(fam.husband_id)
+        if fam.wife_id:
+            nbors.add(fam.wife_id)
+    for fam in spouse_fams:
+        # the other spouse (pid itself is discarded below)
+        if fam.husband_id:
+            nbors.add(fam.husband_id)
+        if fam.wife_id:
+            nbors.add(fam.wife_id)
+        nbors.update(fam.children_ids)
     # ensure we don't return self
     nbors.discard(pid)
     return nbors
@@ -189,17 +187,18 @@ def all_shortest_paths(storage, a_id: str, b_id: str, max_paths: int = 100, max_
     if b_id not in preds:
         return []
 
-    # backtrack from b_id to a_id using preds to enumerate paths
+    # backtrack from b_id to a_id using preds to enumerate paths. An explicit
+    # stack instead of recursion: the depth is the path length, which on a
+    # long ancestry line (no max_depth) can exceed Python's recursion limit.
     paths: List[List[str]] = []
-
-    def backtrack(node: str, acc: List[str]):
-        if len(paths) >= max_paths:
-            return
+    # (node, path from b_id back to node); predecessors are pushed in reverse
+    # so they are explored in the same order as a recursive walk would
+    stack: List[Tuple[str, List[str]]] = [(b_id, [b_id])]
+    while stack and len(paths) < max_paths:
+        node, acc = stack.pop()
         if node == a_id:
-            paths.append(list(reversed(acc + [a_id])))
-            return
-        for p in preds.get(node, []):
-            backtrack(p, acc + [node])
-
-    backtrack(b_id, [])
+            paths.append(acc[::-1])
+            continue
+        for p in reversed(list(preds.get(node, ()))):
+            stack.append((p, acc + [p]))
     return paths
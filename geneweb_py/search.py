@@ -1,9 +1,20 @@
 from __future__ import annotations
-from typing import List, Tuple, Optional
+import heapq
+from operator import itemgetter
+from typing import Iterable, List, Mapping, Sequence, Tuple, Optional, Union
 from .models import Person, Family
 from unicodedata import normalize as _uni_norm
+from functools import lru_cache
 
+# score boost applied to a non-zero match, by person search field name
+_FIELD_BOOST = {"surname": 30, "first_name": 20, "fullname": 10}
+# ranking key of the (score, item) pairs; a C-level getter, not a lambda
+_SCORE = itemgetter(0)
 
+
+# Person fields are re-normalized on every search; names and places repeat
+# across persons and queries, so remember the normalized form per string.
+@lru_cache(maxsize=65536)
 def _normalize_text(s: Optional[str]) -> str:
     if not s:
         return ""
@@ -13,24 +24,38 @@ def _normalize_text(s: Optional[str]) -> str:
     return ascii_only.lower()
 
 
-def _person_search_fields(p: Person) -> List[Tuple[str, str]]:
-    """Return list of (field_name, normalized_text) for searchable person fields."""
+@lru_cache(maxsize=65536)
+def _name_match_fields(first_name: Optional[str], surname: Optional[str]) -> Tuple[Tuple[str, Tuple[str, ...], int], ...]:
+    """Return (normalized_text, words, boost) for the non-empty name fields.
+
+    Keyed on the raw names: they come back unchanged on every query and
+    repeat across persons, so each pair is normalized and split only once.
+    """
+    full = f"{first_name or ''} {surname or ''}".strip()
     fields = []
-    fields.append(("first_name", _normalize_text(p.first_name)))
-    fields.append(("surname", _normalize_text(p.surname)))
-    full = f"{p.first_name or ''} {p.surname or ''}".strip()
-    fields.append(("fullname", _normalize_text(full)))
-    if getattr(p, "birth_place", None):
-        try:
-            fields.append(("birth_place", _normalize_text(p.birth_place.to_simple() or "")))
-        except Exception:
-            fields.append(("birth_place", ""))
+    for fname, raw in (("first_name", first_name), ("surname", surname), ("fullname", full)):
+        txt = _normalize_text(raw)
+        if txt:
+            fields.append((txt, tuple(txt.split()), _FIELD_BOOST[fname]))
+    return tuple(fields)
+
+
+def _person_search_fields(p: Person) -> List[Tuple[str, Sequence[str], int]]:
+    """Return (normalized_text, words, boost) for the non-empty searchable person fields."""
+    fields: List[Tuple[str, Sequence[str], int]] = list(_name_match_fields(p.first_name, p.surname))
+    extra = []
+    # the model fields always exist: read them directly
+    if p.birth_place:
+        extra.append(_normalize_text(p.birth_place.to_simple() or ""))
     # notes and events
-    if getattr(p, "notes", None):
-        fields.append(("notes", _normalize_text(" ".join(p.notes))))
-    if getattr(p, "pevents", None):
-        ev = " ".join([getattr(e, "kind", "") or "" for e in p.pevents])
-        fields.append(("pevents", _normalize_text(ev)))
+    if p.notes:
+        extra.append(_normalize_text(" ".join(p.notes)))
+    if p.pevents:
+        ev = " ".join([e.kind or "" for e in p.pevents])
+        extra.append(_normalize_text(ev))
+    for txt in extra:
+        if txt:
+            fields.append((txt, txt.split(), 0))
     return fields
 
 
@@ -46,7 +71,7 @@ def _family_search_label(f: Family, persons_by_id) -> str:
         if p:
             names.append(p.surname or "")
     # include child surnames as additional tokens
-    for cid in getattr(f, "children_ids", []) or []:
+    for cid in f.children_ids or []:
         p = persons_by_id.get(cid)
         if p:
             names.append(p.surname or "")
@@ -54,7 +79,7 @@ def _family_search_label(f: Family, persons_by_id) -> str:
     return _normalize_text(lab)
 
 
-def search_people(all_persons: List[Person], q: str, limit: int = 50) -> List[Person]:
+def search_people(all_persons: Iterable[Person], q: str, limit: int = 50) -> List[Person]:
     """Search persons by query string q. Returns list of Person ordered by relevance."""
     if not q:
         return []
@@ -65,18 +90,18 @@ def search_people(all_persons: List[Person], q: str, limit: int = 50) -> List[Pe
 
     scored = []
     for p in all_persons:
+        # fields come pre-split with their boost, so the (token, field) loop
+        # below does no per-pair work; empty fields are left out
         fields = _person_search_fields(p)
         score = 0
         matched_all = True
         for tok in tokens:
             tok_matched = False
             best_field_score = 0
-            for fname, txt in fields:
-                if not txt:
-                    continue
+            for txt, words, boost in fields:
                 if txt == tok:
                     s = 100
-                elif txt.split() and tok in txt.split():
+                elif tok in words:
                     s = 70
                 elif txt.startswith(tok):
                     s = 50
@@ -85,12 +110,8 @@ def search_people(all_persons: List[Person], q: str, limit: int = 50) -> List[Pe
                 else:
                     s = 0
                 # boost matches in surname/firstname/fullname
-                if s and fname == "surname":
-                    s += 30
-                if s and fname == "first_name":
-                    s += 20
-                if s and fname == "fullname":
-                    s += 10
+                if s:
+                    s += boost
                 if s > best_field_score:
                     best_field_score = s
                 if s:
@@ -102,14 +123,28 @@ def search_people(all_persons: List[Person], q: str, limit: int = 50) -> List[Pe
         if matched_all and score > 0:
             scored.append((score, p))
 
-    scored.sort(key=lambda x: x[0], reverse=True)
-    return [p for _, p in scored[:limit]]
+    # only the top `limit` hits are returned: select them with a bounded
+    # heap instead of sorting every match (same order as a stable sort)
+    return [p for _, p in heapq.nlargest(limit, scored, key=_SCORE)]
+
 
+def search_families(
+    all_families: Iterable[Family],
+    all_persons: Union[Mapping[str, Person], Iterable[Person]],
+    q: str,
+    limit: int = 50,
+) -> List[Family]:
+    """Search families by the surnames of their members.
 
-def search_families(all_families: List[Family], all_persons: List[Person], q: str, limit: int = 50) -> List[Family]:
+    `all_persons` may be the storage's id -> Person mapping, which is used
+    as-is; any other iterable of persons is indexed by id first.
+    """
     if not q:
         return []
-    persons_by_id = {p.id: p for p in all_persons}
+    if isinstance(all_persons, Mapping):
+        persons_by_id = all_persons
+    else:
+        persons_by_id = {p.id: p for p in all_persons}
     qnorm = _normalize_text(q)
     tokens = [t for t in qnorm.split() if t]
     if not tokens:
@@ -137,5 +172,6 @@ def search_families(all_families: List[Family], all_persons: List[Person], q: st
             score += s
         if matched_all and score > 0:
             scored.append((score, f))
-    scored.sort(key=lambda x: x[0], reverse=True)
-    return [f for _, f in scored[:limit]]
+    # only the top `limit` hits are returned: select them with a bounded
+    # heap instead of sorting every match (same order as a stable sort)
+    return [f for _, f in heapq.nlargest(limit, scored, key=_SCORE)]
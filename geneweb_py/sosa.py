@@ -35,9 +35,8 @@ def _parents_of_person(storage, pid: str) -> Tuple[List[Optional[str]], int]:
     tuple is (None, None). nb_families is the total number of families where
     the person appears as a child.
     """
-    families = list(storage.families_of_person(pid))
     # consider only families where pid is a child
-    child_fams = [f for f in families if pid in getattr(f, "children_ids", [])]
+    child_fams = list(storage.families_as_child(pid))
     nb = len(child_fams)
     if nb == 0:
         return [(None, None)], 0
@@ -16,36 +16,117 @@ import threading
 from .models import Person, Family, Note, CDate, Place, PersEvent
 import sqlite3
 import json
+import gc
+import itertools
+import sys
 import contextvars
+from contextlib import contextmanager
+
+
+# Shared codec instances: json.dumps() builds a fresh JSONEncoder on every
+# call as soon as a non-default option is passed. Compact separators: these
+# blobs are never read by humans, and dropping the default ", "/": " padding
+# shrinks every row and speeds up encoding.
+# orjson is deliberately not used here: it rejects integers beyond 64 bits,
+# writes NaN as null and cannot read back the NaN/Infinity tokens the stdlib
+# encoder emits, so rows would not round-trip.
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+_JSON_DECODER = json.JSONDecoder()
 
 
 def _dict_to_json(obj: Any) -> str:
-    return json.dumps(obj, ensure_ascii=False)
+    return _JSON_ENCODER.encode(obj)
 
 
 def _json_to_dict(s: str) -> Any:
-    return json.loads(s) if s else None
+    if not s:
+        return None
+    return _JSON_DECODER.decode(s)
+
+
+# The cyclic GC switch is process-wide and several bases may load at once on
+# the server's threads: count the loads in progress and only re-enable the
+# collector (if it was on before the first one) when the last one finishes.
+# Trade-off: while any base is loading, every other thread runs without
+# cyclic collection too. Its reference cycles are only reclaimed once the
+# last load ends; plain reference counting keeps working meanwhile.
+_GC_PAUSE_LOCK = threading.Lock()
+_gc_pauses = 0
+_gc_was_enabled = False
+
+
+@contextmanager
+def _gc_paused():
+    global _gc_pauses, _gc_was_enabled
+    with _GC_PAUSE_LOCK:
+        if _gc_pauses == 0:
+            _gc_was_enabled = gc.isenabled()
+            gc.disable()
+        _gc_pauses += 1
+    try:
+        yield
+    finally:
+        with _GC_PAUSE_LOCK:
+            _gc_pauses -= 1
+            if _gc_pauses == 0 and _gc_was_enabled:
+                gc.enable()
+
+
+# Source of Storage.version values. Shared by all instances so a version is
+# never reused, even by a new Storage opened on the same root.
+_VERSIONS = itertools.count(1)
 
 
 class Storage:
-    def __init__(self, root: Path) -> None:
+    def __init__(self, root: Path, readonly: bool = False) -> None:
         self.root = Path(root)
-        self.root.mkdir(parents=True, exist_ok=True)
+        # read-only instances (export, inspection tools) open an existing DB
+        # and never create or migrate anything
+        self.readonly = readonly
+        if not readonly:
+            self.root.mkdir(parents=True, exist_ok=True)
         # simple lock to guard DB writes from multiple threads
         self._lock = threading.RLock()
         # sqlite DB path
         self._db_file = self.root / "storage.db"
         # SQLite connection (opened lazily)
         self._conn = None
+        # > 0 while inside batch(): writes are left uncommitted until it exits
+        self._batch_depth = 0
+        # changes whenever a row is written or deleted; callers may cache
+        # views derived from the in-memory data for as long as it is equal
+        self.version = next(_VERSIONS)
         self._connect()
-        self._ensure_tables()
-        self._load()
+        if not readonly:
+            self._ensure_tables()
+        # Loading allocates a large number of long-lived objects and no garbage
+        # cycles; with the collector running, every few hundred allocations
+        # trigger a pass over everything built so far.
+        with _gc_paused():
+            self._load()
 
     def _connect(self) -> None:
         if self._conn is None:
             # Allow using the connection from different threads (uvicorn/fastapi may run handlers
             # in worker threads). We'll protect concurrent access with a threading lock.
-            self._conn = sqlite3.connect(str(self._db_file), check_same_thread=False)
+            if self.readonly:
+                if not self._db_file.exists():
+                    raise FileNotFoundError(f"No storage database at {self._db_file}")
+                # mode=ro: no write lock, no journal; mmap lets SQLite read
+                # pages straight from the page cache instead of copying them
+                self._conn = sqlite3.connect(
+                    self._db_file.resolve().as_uri() + "?mode=ro", uri=True, check_same_thread=False
+                )
+                self._conn.execute("PRAGMA mmap_size = 268435456")
+            else:
+                self._conn = sqlite3.connect(str(self._db_file), check_same_thread=False)
+                # WAL: a commit appends to the log instead of rewriting pages
+                # through a rollback journal, and readers (other workers, a
+                # read-only export) are not blocked by a writer. NORMAL sync
+                # is durable in WAL mode except for the last commits on power
+                # loss, and avoids an fsync per transaction.
+                self._conn.execute("PRAGMA journal_mode = WAL")
+                self._conn.execute("PRAGMA synchronous = NORMAL")
             # Use row factory for convenience
             self._conn.row_factory = sqlite3.Row
 
@@ -80,6 +161,10 @@ class Storage:
                 family_id TEXT,
                 child_id TEXT
             );
+            -- child rows are rewritten/deleted per family and looked up per
+            -- child; without these every such statement scans the table
+            CREATE INDEX IF NOT EXISTS family_children_family ON family_children(family_id);
+            CREATE INDEX IF NOT EXISTS family_children_child ON family_children(child_id);
             CREATE TABLE IF NOT EXISTS notes(
                 id TEXT PRIMARY KEY,
                 title TEXT,
@@ -96,48 +181,52 @@ class Storage:
         self.notes: Dict[str, Note] = {}
 
         cur = self._conn.cursor()
-        # Load persons from normalized + JSON columns
+        # Load persons from normalized + JSON columns. Rows are consumed
+        # straight from the cursor rather than fetchall()'d into a list that
+        # would hold every row alongside the objects built from them.
         cur.execute(
             "SELECT id, first_name, surname, sex, birth_date, birth_place_json, birth_note, death_date, death_place_json, death_note, pevents_json, notes_json FROM persons"
         )
-        for row in cur.fetchall():
+        for row in cur:
             try:
                 notes_list = []
                 if row["notes_json"]:
                     try:
-                        notes_list = json.loads(row["notes_json"])
+                        notes_list = _json_to_dict(row["notes_json"])
                     except Exception:
                         notes_list = []
                 # parse birth/death places as structured Place if present
                 birth_place = None
                 if row["birth_place_json"]:
                     try:
-                        birth_place = Place.from_dict(json.loads(row["birth_place_json"]))
+                        birth_place = Place.from_dict(_json_to_dict(row["birth_place_json"]))
                     except Exception:
                         birth_place = None
                 death_place = None
                 if row["death_place_json"]:
                     try:
-                        death_place = Place.from_dict(json.loads(row["death_place_json"]))
+                        death_place = Place.from_dict(_json_to_dict(row["death_place_json"]))
                     except Exception:
                         death_place = None
                 # parse pevents
                 pevents = []
                 if row["pevents_json"]:
                     try:
-                        evs = json.loads(row["pevents_json"]) or []
+                        evs = _json_to_dict(row["pevents_json"]) or []
                         pevents = [PersEvent.from_dict(e) for e in evs]
                     except Exception:
                         pevents = []
                 p = Person(
                     id=row["id"],
-                    first_name=row["first_name"] or "",
-                    surname=row["surname"] or "",
-                    sex=row["sex"],
-                    birth_date=CDate.from_string(row["birth_date"]) if row["birth_date"] else None,
+                    # first names, surnames and sex codes repeat across many
+                    # rows: intern them so each distinct value is stored once
+                    first_name=sys.intern(row["first_name"] or ""),
+                    surname=sys.intern(row["surname"] or ""),
+                    sex=sys.intern(row["sex"]) if row["sex"] else row["sex"],
+                    birth_date=CDate.from_iso(row["birth_date"]),
                     birth_place=birth_place,
                     birth_note=row["birth_note"],
-                    death_date=CDate.from_string(row["death_date"]) if row["death_date"] else None,
+                    death_date=CDate.from_iso(row["death_date"]),
                     death_place=death_place,
                     death_note=row["death_note"],
                     pevents=pevents,
@@ -147,19 +236,23 @@ class Storage:
             except Exception:
                 continue
 
-        # Load families and their children
+        # Load all child links in one query (rowid order keeps the children's
+        # order within each family) instead of one query per family
+        children_by_family: Dict[str, List[str]] = {}
+        cur.execute("SELECT family_id, child_id FROM family_children ORDER BY rowid")
+        for row in cur:
+            children_by_family.setdefault(row["family_id"], []).append(row["child_id"])
+
+        # Load families
         cur.execute("SELECT id, husband_id, wife_id, fevents_json FROM families")
-        for row in cur.fetchall():
+        for row in cur:
             try:
                 fid = row["id"]
-                # collect children
-                cur2 = self._conn.cursor()
-                cur2.execute("SELECT child_id FROM family_children WHERE family_id = ?", (fid,))
-                children = [r["child_id"] for r in cur2.fetchall()]
+                children = children_by_family.get(fid, [])
                 fevents_list = []
                 if row["fevents_json"]:
                     try:
-                        fevents_list = json.loads(row["fevents_json"]) or []
+                        fevents_list = _json_to_dict(row["fevents_json"]) or []
                     except Exception:
                         fevents_list = []
                 d = {
@@ -176,7 +269,7 @@ class Storage:
 
         # Load notes
         cur.execute("SELECT id, title, text FROM notes")
-        for row in cur.fetchall():
+        for row in cur:
             try:
                 d = {"id": row["id"], "title": row["title"] or "", "text": row["text"] or ""}
                 n = Note.from_dict(d)
@@ -191,88 +284,180 @@ class Storage:
                 except Exception:
                     rel = p.name
                 nid = rel[:-4] if rel.endswith(".txt") else rel
+                # Bodies are not read here: get_note()/list_notes() always read
+                # the file itself, so a note committed through commit_note()
+                # (which also stores a DB row) needs no startup I/O. Only files
+                # dropped into notes_d/ without metadata are registered.
+                if nid in self.notes:
+                    continue
                 try:
                     txt = read_text(p, default="") or ""
                 except Exception:
                     txt = ""
                 title = p.stem
-                # File-backed notes override DB entries
                 self.notes[nid] = Note(id=nid, title=title, text=txt)
-        # Build initial family index for fast lookups
+        # Build initial family and surname indexes for fast lookups
         self._rebuild_index()
+        self._rebuild_surname_index()
 
     def _save(self) -> None:
-        # Persist current in-memory dictionaries into the SQLite DB
-        # Acquire lock to avoid concurrent sqlite access from different threads
-        with self._lock:
+        # Full resync: rewrite the SQLite DB from the in-memory dictionaries.
+        # Regular mutations persist only the rows they touch (see below).
+        # Runs as one transaction under the lock: either the whole snapshot
+        # is written or, on error, the previous content is kept.
+        with self.batch():
             cur = self._conn.cursor()
-        # Replace persons (normalized + JSON columns)
-        cur.execute("DELETE FROM persons")
-        for p in self.persons.values():
-            birth_date = p.birth_date.to_iso() if p.birth_date else None
-            birth_place_json = json.dumps(p.birth_place.to_dict(), ensure_ascii=False) if p.birth_place else None
-            birth_note = p.birth_note if getattr(p, "birth_note", None) else None
-            death_date = p.death_date.to_iso() if p.death_date else None
-            death_place_json = json.dumps(p.death_place.to_dict(), ensure_ascii=False) if p.death_place else None
-            death_note = p.death_note if getattr(p, "death_note", None) else None
-            pevents_json = json.dumps([e.to_dict() for e in p.pevents], ensure_ascii=False) if p.pevents else None
-            notes_json = json.dumps(p.notes, ensure_ascii=False) if p.notes else None
-            cur.execute(
-                "INSERT INTO persons(id, first_name, surname, sex, birth_date, birth_place_json, birth_note, death_date, death_place_json, death_note, pevents_json, notes_json) VALUES(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
-                (
-                    p.id,
-                    p.first_name,
-                    p.surname,
-                    p.sex,
-                    birth_date,
-                    birth_place_json,
-                    birth_note,
-                    death_date,
-                    death_place_json,
-                    death_note,
-                    pevents_json,
-                    notes_json,
-                ),
-            )
+            # Replace persons (normalized + JSON columns)
+            cur.execute("DELETE FROM persons")
+            for p in self.persons.values():
+                cur.execute(
+                    "INSERT INTO persons(id, first_name, surname, sex, birth_date, birth_place_json, birth_note, death_date, death_place_json, death_note, pevents_json, notes_json) VALUES(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    self._person_row(p),
+                )
 
-        # Replace families and family_children
-        cur.execute("DELETE FROM family_children")
-        cur.execute("DELETE FROM families")
-        for fa in self.families.values():
-            fevents_json = json.dumps([e.to_dict() for e in getattr(fa, "fevents", [])], ensure_ascii=False) if getattr(fa, "fevents", None) else None
-            cur.execute(
-                "INSERT INTO families(id, husband_id, wife_id, fevents_json) VALUES(?, ?, ?, ?)",
-                (fa.id, fa.husband_id, fa.wife_id, fevents_json),
-            )
-            # insert children rows
-            for cid in fa.children_ids:
+            # Replace families and family_children
+            cur.execute("DELETE FROM family_children")
+            cur.execute("DELETE FROM families")
+            for fa in self.families.values():
                 cur.execute(
-                    "INSERT INTO family_children(family_id, child_id) VALUES(?, ?)",
-                    (fa.id, cid),
+                    "INSERT INTO families(id, husband_id, wife_id, fevents_json) VALUES(?, ?, ?, ?)",
+                    self._family_row(fa),
                 )
+                # insert children rows
+                for cid in fa.children_ids:
+                    cur.execute(
+                        "INSERT INTO family_children(family_id, child_id) VALUES(?, ?)",
+                        (fa.id, cid),
+                    )
+
+            # Replace notes metadata
+            cur.execute("DELETE FROM notes")
+            for n in self.notes.values():
+                cur.execute("INSERT INTO notes(id, title, text) VALUES(?, ?, ?)", (n.id, n.title, n.text))
+
+    @contextmanager
+    def batch(self):
+        """Group several mutations into a single SQLite transaction.
+
+        Writes made inside the block are committed once when the outermost
+        `batch()` exits instead of after every add/update call. If the block
+        raises, the outermost `batch()` rolls the transaction back so the DB
+        never keeps a half-applied change, and reloads the in-memory dicts
+        and indexes from it: mutations are applied to memory before their
+        rows are written, so memory would otherwise keep the failed change.
+        Blocks may be nested.
+        """
+        with self._lock:
+            self._batch_depth += 1
+            try:
+                yield self
+            except BaseException:
+                self._batch_depth -= 1
+                if self._batch_depth == 0:
+                    self._conn.rollback()
+                    self._load()
+                    # views cached from the discarded state must not be reused
+                    self.version = next(_VERSIONS)
+                raise
+            else:
+                self._batch_depth -= 1
+                if self._batch_depth == 0:
+                    self._conn.commit()
+
+    # --- Row-level persistence: write only the rows touched by a mutation ---
+    def _person_row(self, p: Person) -> tuple:
+        return (
+            p.id,
+            p.first_name,
+            p.surname,
+            p.sex,
+            p.birth_date.to_iso() if p.birth_date else None,
+            _dict_to_json(p.birth_place.to_dict()) if p.birth_place else None,
+            p.birth_note or None,
+            p.death_date.to_iso() if p.death_date else None,
+            _dict_to_json(p.death_place.to_dict()) if p.death_place else None,
+            p.death_note or None,
+            _dict_to_json([e.to_dict() for e in p.pevents]) if p.pevents else None,
+            _dict_to_json(p.notes) if p.notes else None,
+        )
 
-        # Replace notes metadata
-        cur.execute("DELETE FROM notes")
-        for n in self.notes.values():
-            cur.execute("INSERT INTO notes(id, title, text) VALUES(?, ?, ?)", (n.id, n.title, n.text))
+    def _family_row(self, fa: Family) -> tuple:
+        fevents_json = _dict_to_json([e.to_dict() for e in fa.fevents]) if fa.fevents else None
+        return (fa.id, fa.husband_id, fa.wife_id, fevents_json)
 
-        self._conn.commit()
-        # Ensure index stays consistent with current families
-        self._rebuild_index()
+    def _write_person(self, p: Person) -> None:
+        self._write_persons([p])
+
+    def _write_persons(self, persons: List[Person]) -> None:
+        self.version = next(_VERSIONS)
+        with self.batch():
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO persons(id, first_name, surname, sex, birth_date, birth_place_json, birth_note, death_date, death_place_json, death_note, pevents_json, notes_json) VALUES(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [self._person_row(p) for p in persons],
+            )
+
+    def _write_family(self, fa: Family) -> None:
+        self._write_families([fa])
+
+    def _write_families(self, families: List[Family]) -> None:
+        self.version = next(_VERSIONS)
+        with self.batch():
+            cur = self._conn.cursor()
+            cur.executemany(
+                "INSERT OR REPLACE INTO families(id, husband_id, wife_id, fevents_json) VALUES(?, ?, ?, ?)",
+                [self._family_row(fa) for fa in families],
+            )
+            # children rows are replaced as a whole for these families only
+            cur.executemany("DELETE FROM family_children WHERE family_id = ?", [(fa.id,) for fa in families])
+            cur.executemany(
+                "INSERT INTO family_children(family_id, child_id) VALUES(?, ?)",
+                [(fa.id, cid) for fa in families for cid in fa.children_ids],
+            )
+
+    def _write_note(self, n: Note) -> None:
+        self.version = next(_VERSIONS)
+        with self.batch():
+            self._conn.execute(
+                "INSERT OR REPLACE INTO notes(id, title, text) VALUES(?, ?, ?)", (n.id, n.title, n.text)
+            )
+
+    def _delete_rows(self, table: str, column: str, key: str) -> None:
+        self.version = next(_VERSIONS)
+        with self.batch():
+            self._conn.execute(f"DELETE FROM {table} WHERE {column} = ?", (key,))
 
     # Person operations
     def add_person(self, person: Person) -> None:
+        self._unindex_surname(person.id)
         self.persons[person.id] = person
-        self._save()
+        self._index_surname(person)
+        self._write_person(person)
+
+    def add_persons(self, persons: Iterable[Person]) -> None:
+        """Add many persons with a single batched INSERT (imports)."""
+        persons = list(persons)
+        for person in persons:
+            self._unindex_surname(person.id)
+            self.persons[person.id] = person
+            self._index_surname(person)
+        self._write_persons(persons)
 
     def get_person(self, pid: str) -> Optional[Person]:
         return self.persons.get(pid)
 
+    def get_persons(self, *pids: Optional[str]) -> List[Optional[Person]]:
+        """Look up several persons in one call; missing or empty ids give None."""
+        get = self.persons.get
+        return [get(pid) if pid else None for pid in pids]
+
     def list_persons(self) -> List[Person]:
         return list(self.persons.values())
 
     # Family operations
     def add_family(self, family: Family) -> None:
+        # re-adding an existing id replaces it: drop what was indexed for the
+        # previous version first, or its members would keep pointing here
+        self._unindex_family(family)
         self.families[family.id] = family
         # incremental index update
         try:
@@ -281,7 +466,16 @@ class Storage:
             # ensure index exists
             self._rebuild_index()
             self._index_family(family)
-        self._save()
+        self._write_family(family)
+
+    def add_families(self, families: Iterable[Family]) -> None:
+        """Add many families with batched INSERTs (imports)."""
+        families = list(families)
+        for family in families:
+            self._unindex_family(family)
+            self.families[family.id] = family
+            self._index_family(family)
+        self._write_families(families)
 
     def get_family(self, fid: str) -> Optional[Family]:
         return self.families.get(fid)
@@ -289,7 +483,7 @@ class Storage:
     # Notes
     def add_note(self, note: Note) -> None:
         self.notes[note.id] = note
-        self._save()
+        self._write_note(note)
 
     def get_note(self, nid: str) -> Optional[Note]:
         # If a file exists in notes_d, prefer its content
@@ -305,37 +499,92 @@ class Storage:
 
     # --- Family indexing: person_id -> set of family ids ---
     def _rebuild_index(self) -> None:
-        # Map person id -> set of family ids where they appear
+        # Map person id -> set of family ids where they appear (any role)
         self.families_by_person: Dict[str, Set[str]] = {}
+        # Role-specific maps so graph walks don't have to filter every family
+        # of a person: families where the person is a parent (husband/wife)
+        # and families where the person is one of the children.
+        self.spouse_families_by_person: Dict[str, Set[str]] = {}
+        self.child_families_by_person: Dict[str, Set[str]] = {}
+        # family id -> (husband_id, wife_id, children_ids) as last indexed
+        self._indexed_family_keys: Dict[str, tuple] = {}
         for fid, fam in self.families.items():
             self._index_family(fam)
 
     def _index_family(self, fam: Family) -> None:
         fid = fam.id
+        # Remember what was indexed: callers mutate Family objects in place
+        # before update_family(), so the previous ids can't be read back from
+        # the object when it has to be unindexed.
+        self._indexed_family_keys[fid] = (fam.husband_id, fam.wife_id, tuple(fam.children_ids))
         if fam.husband_id:
             self.families_by_person.setdefault(fam.husband_id, set()).add(fid)
+            self.spouse_families_by_person.setdefault(fam.husband_id, set()).add(fid)
         if fam.wife_id:
             self.families_by_person.setdefault(fam.wife_id, set()).add(fid)
+            self.spouse_families_by_person.setdefault(fam.wife_id, set()).add(fid)
         for cid in fam.children_ids:
             self.families_by_person.setdefault(cid, set()).add(fid)
+            self.child_families_by_person.setdefault(cid, set()).add(fid)
 
     def _unindex_family(self, fam: Family) -> None:
         fid = fam.id
-        if fam.husband_id and fam.husband_id in self.families_by_person:
-            self.families_by_person.get(fam.husband_id, set()).discard(fid)
-        if fam.wife_id and fam.wife_id in self.families_by_person:
-            self.families_by_person.get(fam.wife_id, set()).discard(fid)
-        for cid in fam.children_ids:
+        keys = self._indexed_family_keys.pop(fid, None)
+        if keys is None:
+            return
+        husband_id, wife_id, children_ids = keys
+        if husband_id and husband_id in self.families_by_person:
+            self.families_by_person.get(husband_id, set()).discard(fid)
+            self.spouse_families_by_person.get(husband_id, set()).discard(fid)
+        if wife_id and wife_id in self.families_by_person:
+            self.families_by_person.get(wife_id, set()).discard(fid)
+            self.spouse_families_by_person.get(wife_id, set()).discard(fid)
+        for cid in children_ids:
             if cid in self.families_by_person:
                 self.families_by_person.get(cid, set()).discard(fid)
+                self.child_families_by_person.get(cid, set()).discard(fid)
+
+    # --- Surname indexing: casefolded surname -> set of person ids ---
+    def _rebuild_surname_index(self) -> None:
+        self.pids_by_surname: Dict[str, Set[str]] = {}
+        # person id -> key as last indexed (persons are edited in place
+        # before update_person(), like families)
+        self._indexed_surnames: Dict[str, str] = {}
+        for p in self.persons.values():
+            self._index_surname(p)
 
-    def families_of_person(self, pid: str) -> Iterable[Family]:
-        fids = self.families_by_person.get(pid, set())
+    def _index_surname(self, p: Person) -> None:
+        key = (p.surname or "").casefold()
+        self._indexed_surnames[p.id] = key
+        self.pids_by_surname.setdefault(key, set()).add(p.id)
+
+    def _unindex_surname(self, pid: str) -> None:
+        key = self._indexed_surnames.pop(pid, None)
+        if key is not None:
+            self.pids_by_surname.get(key, set()).discard(pid)
+
+    def persons_by_surname(self, surname: str) -> List[Person]:
+        """Persons whose surname matches `surname`, ignoring case."""
+        pids = self.pids_by_surname.get((surname or "").casefold(), ())
+        return [self.persons[pid] for pid in pids]
+
+    def _families_from(self, fids: Iterable[str]) -> Iterable[Family]:
         for fid in fids:
             fam = self.families.get(fid)
             if fam:
                 yield fam
 
+    def families_of_person(self, pid: str) -> Iterable[Family]:
+        return self._families_from(self.families_by_person.get(pid, set()))
+
+    def families_as_spouse(self, pid: str) -> Iterable[Family]:
+        """Families where `pid` is the husband or the wife."""
+        return self._families_from(self.spouse_families_by_person.get(pid, set()))
+
+    def families_as_child(self, pid: str) -> Iterable[Family]:
+        """Families where `pid` is one of the children (i.e. their parents)."""
+        return self._families_from(self.child_families_by_person.get(pid, set()))
+
     # Notes helpers
     def list_notes(self) -> Iterable[Note]:
         """List all notes from notes.json and notes_d (file-backed)."""
@@ -376,7 +625,7 @@ class Storage:
         atomic_write_text(path, text)
         # Update notes metadata cache
         self.notes[nid] = Note(id=nid, title=title or path.stem, text=text)
-        self._save()
+        self._write_note(self.notes[nid])
 
     def delete_note(self, nid: str) -> bool:
         # Remove file if exists
@@ -391,22 +640,29 @@ class Storage:
         # Remove from notes.json cache
         if nid in self.notes:
             del self.notes[nid]
-            self._save()
+            self._delete_rows("notes", "id", nid)
             removed = True
         return removed
 
     # Update / Delete operations
     def update_person(self, person: Person) -> None:
         if person.id in self.persons:
+            self._unindex_surname(person.id)
             self.persons[person.id] = person
-            self._save()
+            self._index_surname(person)
+            self._write_person(person)
         else:
             raise KeyError(f"Person {person.id} not found")
 
     def delete_person(self, pid: str) -> bool:
-        if pid in self.persons:
-            # Remove references in families
-            for fid, fam in list(self.families.items()):
+        if pid not in self.persons:
+            return False
+        # one transaction for the person row and every family it is removed from
+        with self.batch():
+            # Remove references in families; the person index names exactly
+            # the families that mention pid, so no scan of all families.
+            # Copy first: re-indexing below mutates the underlying set.
+            for fam in list(self.families_of_person(pid)):
                 changed = False
                 if fam.husband_id == pid:
                     fam.husband_id = None
@@ -418,13 +674,13 @@ class Storage:
                     fam.children_ids = [c for c in fam.children_ids if c != pid]
                     changed = True
                 if changed:
-                    self.families[fid] = fam
-            # rebuild index after modifications
-            self._rebuild_index()
+                    self._unindex_family(fam)
+                    self._index_family(fam)
+                    self._write_family(fam)
             del self.persons[pid]
-            self._save()
-            return True
-        return False
+            self._unindex_surname(pid)
+            self._delete_rows("persons", "id", pid)
+        return True
 
     def update_family(self, family: Family) -> None:
         if family.id in self.families:
@@ -441,7 +697,7 @@ class Storage:
             except Exception:
                 self._rebuild_index()
                 self._index_family(family)
-            self._save()
+            self._write_family(family)
         else:
             raise KeyError(f"Family {family.id} not found")
 
@@ -454,9 +710,9 @@ class Storage:
                 # fallback to full rebuild later
                 pass
             del self.families[fid]
-            # ensure index correctness
-            self._rebuild_index()
-            self._save()
+            with self.batch():
+                self._delete_rows("family_children", "family_id", fid)
+                self._delete_rows("families", "id", fid)
             return True
         return False
 
@@ -497,6 +753,8 @@ class StorageManager:
         self.root.mkdir(parents=True, exist_ok=True)
         self._lock = threading.RLock()
         self._cache: Dict[str, Storage] = {}
+        # one lock per base name, so loading one base does not block others
+        self._base_locks: Dict[str, threading.Lock] = {}
 
     def list_bases(self) -> List[str]:
         """Return sorted list of available base names (subdirectories that look
@@ -513,10 +771,21 @@ class StorageManager:
 
     def get_storage(self, name: str) -> Storage:
         """Return a Storage instance for base `name`. Creates one lazily and
-        caches it for reuse within this process."""
+        caches it for reuse within this process.
+
+        The manager lock only guards the per-base lock table; the (possibly
+        slow) Storage load runs under the lock of that base alone, so
+        different bases can be opened concurrently.
+        """
+        s = self._cache.get(name)
+        if s is not None:
+            return s
         with self._lock:
-            if name in self._cache:
-                return self._cache[name]
+            base_lock = self._base_locks.setdefault(name, threading.Lock())
+        with base_lock:
+            s = self._cache.get(name)
+            if s is not None:
+                return s
             root = self.root / name
             root.mkdir(parents=True, exist_ok=True)
             s = Storage(root)
@@ -3,6 +3,7 @@ from fastapi.responses import HTMLResponse, RedirectResponse, JSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from pathlib import Path
+from contextlib import contextmanager
 from .. import storage as storage_mod
 from ..models import Person, Family, CDate, Place, PersEvent
 from typing import List, Optional, Dict, Any
@@ -14,7 +15,24 @@ import gettext
 from pathlib import Path as _Path
 from ..search import search_people, search_families
 
-app = FastAPI(title="geneweb-py")
+try:
+    # optional: orjson serializes API payloads much faster than the stdlib
+    # json module FastAPI's JSONResponse uses; fall back when not installed
+    import orjson  # noqa: F401
+    from fastapi.responses import ORJSONResponse
+
+    class _DefaultJSONResponse(ORJSONResponse):
+        def render(self, content: Any) -> bytes:
+            try:
+                return super().render(content)
+            except TypeError:
+                # orjson rejects integers beyond 64 bits (e.g. a stored event
+                # year); the stdlib encoder handles them
+                return JSONResponse.render(self, content)
+except ImportError:
+    _DefaultJSONResponse = JSONResponse
+
+app = FastAPI(title="geneweb-py", default_response_class=_DefaultJSONResponse)
 
 # Ensure basic logging is configured so integration-test server logs at INFO are visible
 logging.basicConfig(level=logging.INFO)
@@ -265,42 +283,75 @@ def people_list(request: Request):
     return localized_template_response("people_list.html", {"request": request, "persons": persons})
 
 
-@app.get("/families", response_class=HTMLResponse)
-def families_list(request: Request):
-    families = list(storage.families.values())
-    # Build a display-friendly list of parent family names for each family
-    def format_parent_names(names):
-        # names: list of surname strings (ordered)
-        # keep unique while preserving order
-        seen = set()
-        out = []
-        for n in names:
-            if not n:
-                continue
-            if n not in seen:
-                seen.add(n)
-                out.append(n)
-        if len(out) == 0:
-            return "(unknown)"
-        if len(out) == 1:
-            return out[0]
-        if len(out) == 2:
-            return f"{out[0]} and {out[1]}"
-        # 3+ names: comma separated with 'and' before last
-        return ", ".join(out[:-1]) + f" and {out[-1]}"
-
+def _format_parent_names(names):
+    # names: list of surname strings (ordered)
+    # keep unique while preserving order
+    seen = set()
+    out = []
+    for n in names:
+        if not n:
+            continue
+        if n not in seen:
+            seen.add(n)
+            out.append(n)
+    if len(out) == 0:
+        return "(unknown)"
+    if len(out) == 1:
+        return out[0]
+    if len(out) == 2:
+        return f"{out[0]} and {out[1]}"
+    # 3+ names: comma separated with 'and' before last
+    return ", ".join(out[:-1]) + f" and {out[-1]}"
+
+
+def _build_families_display() -> List[Dict[str, str]]:
+    """Build a display-friendly list of parent family names for each family."""
     families_display = []
-    for f in families:
-        husband = storage.get_person(f.husband_id) if f.husband_id else None
-        wife = storage.get_person(f.wife_id) if f.wife_id else None
+    # resolve the request's storage once, not through the proxy per family
+    get_persons = storage.get_persons
+    # snapshot: other requests may add or delete families meanwhile
+    for f in list(storage.families.values()):
+        husband, wife = get_persons(f.husband_id, f.wife_id)
         # collect surnames from parents in husband->wife order
         names = []
         if husband:
             names.append(husband.surname or "")
         if wife:
             names.append(wife.surname or "")
-        label = format_parent_names(names)
+        label = _format_parent_names(names)
         families_display.append({"id": f.id, "label": label})
+    return families_display
+
+
+# base root -> (storage version, families_list display rows)
+_families_display_cache: Dict[str, Any] = {}
+
+
+@contextmanager
+def _in_place_edit():
+    """Wrap handlers that edit stored objects in place before persisting them.
+
+    `storage.version` only moves once a row is written: if the handler fails
+    in between, memory has changed but the version has not, so the cached
+    families rows are dropped."""
+    try:
+        yield
+    except BaseException:
+        _families_display_cache.pop(str(storage.root), None)
+        raise
+
+
+@app.get("/families", response_class=HTMLResponse)
+def families_list(request: Request):
+    # the rows only change with the base: reuse them while its version holds
+    key = str(storage.root)
+    version = storage.version
+    cached = _families_display_cache.get(key)
+    if cached is not None and cached[0] == version:
+        families_display = cached[1]
+    else:
+        families_display = _build_families_display()
+        _families_display_cache[key] = (version, families_display)
 
     return localized_template_response("families_list.html", {"request": request, "families": families_display})
 
@@ -327,20 +378,6 @@ def create_person(
     pevent_note: List[str] = Form([]),
 ):
     logging.info("create_person called with first_name=%s, surname=%s, sex=%s", first_name, surname, sex)
-    p = Person(first_name=first_name, surname=surname, sex=sex)
-    # parse optional structured fields from simple textual inputs
-    if birth_date:
-        p.birth_date = CDate.from_string(birth_date)
-    if birth_place:
-        p.birth_place = Place.from_simple(birth_place)
-    if birth_note:
-        p.birth_note = birth_note
-    if death_date:
-        p.death_date = CDate.from_string(death_date)
-    if death_place:
-        p.death_place = Place.from_simple(death_place)
-    if death_note:
-        p.death_note = death_note
     # parse person events from repeated form fields (server-side dynamic rows)
     evs: list[PersEvent] = []
     for i, kind in enumerate(pevent_kind or []):
@@ -350,10 +387,22 @@ def create_person(
         place = Place.from_simple(pevent_place[i]) if i < len(pevent_place) and pevent_place[i] else None
         note = pevent_note[i] if i < len(pevent_note) and pevent_note[i] else None
         evs.append(PersEvent(kind=kind, date=date, place=place, note=note))
-    p.pevents = evs
+    # build the person in one go; the parsers return None for empty inputs
+    p = Person(
+        first_name=first_name,
+        surname=surname,
+        sex=sex,
+        birth_date=CDate.from_string(birth_date),
+        birth_place=Place.from_simple(birth_place),
+        birth_note=birth_note or None,
+        death_date=CDate.from_string(death_date),
+        death_place=Place.from_simple(death_place),
+        death_note=death_note or None,
+        pevents=evs,
+    )
     try:
         storage.add_person(p)
-        logging.info("Created person %s; persons now: %s", p.id, list(storage.persons.keys()))
+        logging.info("Created person %s; persons_count: %d", p.id, len(storage.persons))
     except Exception:
         logging.exception("Failed to add person %s", p.id)
         raise
@@ -392,36 +441,37 @@ def edit_person(
     p = storage.get_person(pid)
     if p is None:
         raise HTTPException(status_code=404, detail="Person not found")
-    p.first_name = first_name
-    p.surname = surname
-    p.sex = sex
-    # parse optional structured fields
-    if birth_date is not None:
-        p.birth_date = CDate.from_string(birth_date)
-    if birth_place is not None:
-        p.birth_place = Place.from_simple(birth_place)
-    if birth_note is not None:
-        p.birth_note = birth_note
-    if death_date is not None:
-        p.death_date = CDate.from_string(death_date)
-    if death_place is not None:
-        p.death_place = Place.from_simple(death_place)
-    if death_note is not None:
-        p.death_note = death_note
-    # parse pevents from repeated form fields (replace existing list)
-    evs: list[PersEvent] = []
-    for i, kind in enumerate(pevent_kind or []):
-        action = pevent_action[i] if i < len(pevent_action) else ""
-        if action == "remove":
-            continue
-        if not kind:
-            continue
-        date = CDate.from_string(pevent_date[i]) if i < len(pevent_date) and pevent_date[i] else None
-        place = Place.from_simple(pevent_place[i]) if i < len(pevent_place) and pevent_place[i] else None
-        note = pevent_note[i] if i < len(pevent_note) and pevent_note[i] else None
-        evs.append(PersEvent(kind=kind, date=date, place=place, note=note))
-    p.pevents = evs
-    storage.update_person(p)
+    with _in_place_edit():
+        p.first_name = first_name
+        p.surname = surname
+        p.sex = sex
+        # parse optional structured fields
+        if birth_date is not None:
+            p.birth_date = CDate.from_string(birth_date)
+        if birth_place is not None:
+            p.birth_place = Place.from_simple(birth_place)
+        if birth_note is not None:
+            p.birth_note = birth_note
+        if death_date is not None:
+            p.death_date = CDate.from_string(death_date)
+        if death_place is not None:
+            p.death_place = Place.from_simple(death_place)
+        if death_note is not None:
+            p.death_note = death_note
+        # parse pevents from repeated form fields (replace existing list)
+        evs: list[PersEvent] = []
+        for i, kind in enumerate(pevent_kind or []):
+            action = pevent_action[i] if i < len(pevent_action) else ""
+            if action == "remove":
+                continue
+            if not kind:
+                continue
+            date = CDate.from_string(pevent_date[i]) if i < len(pevent_date) and pevent_date[i] else None
+            place = Place.from_simple(pevent_place[i]) if i < len(pevent_place) and pevent_place[i] else None
+            note = pevent_note[i] if i < len(pevent_note) and pevent_note[i] else None
+            evs.append(PersEvent(kind=kind, date=date, place=place, note=note))
+        p.pevents = evs
+        storage.update_person(p)
     return RedirectResponse(url=f"/person/{pid}", status_code=303)
 
 
@@ -429,86 +479,78 @@ def edit_person(
 @app.post("/api/person", status_code=201)
 def api_create_person(data: Dict[str, Any]):
     # Accept JSON payload with simple textual fields for dates and places
-    first_name = data.get("first_name", "")
-    surname = data.get("surname", "")
-    sex = data.get("sex")
-    p = Person(first_name=first_name, surname=surname, sex=sex)
-    bd = data.get("birth_date")
-    if bd:
-        p.birth_date = CDate.from_string(bd)
-    bp = data.get("birth_place")
-    if bp:
-        p.birth_place = Place.from_simple(bp)
-    if data.get("birth_note"):
-        p.birth_note = data.get("birth_note")
     # parse pevents from JSON - accept list of simple textual lines or list of dicts
-    if data.get("pevents"):
-        pe = []
-        for item in data.get("pevents"):
-            if isinstance(item, str):
-                parts = [x.strip() for x in item.split("|")]
-                kind = parts[0] if len(parts) > 0 else ""
-                date = CDate.from_string(parts[1]) if len(parts) > 1 and parts[1] else None
-                place = Place.from_simple(parts[2]) if len(parts) > 2 and parts[2] else None
-                note = parts[3] if len(parts) > 3 and parts[3] else None
-                pe.append(PersEvent(kind=kind, date=date, place=place, note=note))
-            elif isinstance(item, dict):
-                pe.append(PersEvent.from_dict(item))
-        p.pevents = pe
-    dd = data.get("death_date")
-    if dd:
-        p.death_date = CDate.from_string(dd)
-    dp = data.get("death_place")
-    if dp:
-        p.death_place = Place.from_simple(dp)
-    if data.get("death_note"):
-        p.death_note = data.get("death_note")
+    pe = []
+    for item in data.get("pevents") or []:
+        if isinstance(item, str):
+            parts = [x.strip() for x in item.split("|")]
+            kind = parts[0] if len(parts) > 0 else ""
+            date = CDate.from_string(parts[1]) if len(parts) > 1 and parts[1] else None
+            place = Place.from_simple(parts[2]) if len(parts) > 2 and parts[2] else None
+            note = parts[3] if len(parts) > 3 and parts[3] else None
+            pe.append(PersEvent(kind=kind, date=date, place=place, note=note))
+        elif isinstance(item, dict):
+            pe.append(PersEvent.from_dict(item))
+    p = Person(
+        first_name=data.get("first_name", ""),
+        surname=data.get("surname", ""),
+        sex=data.get("sex"),
+        birth_date=CDate.from_string(data.get("birth_date")),
+        birth_place=Place.from_simple(data.get("birth_place")),
+        birth_note=data.get("birth_note") or None,
+        death_date=CDate.from_string(data.get("death_date")),
+        death_place=Place.from_simple(data.get("death_place")),
+        death_note=data.get("death_note") or None,
+        pevents=pe,
+    )
     storage.add_person(p)
     return p.to_dict()
 
 
+# Person fields a JSON update may set -> parser for the submitted text (None:
+# stored as-is). The parsers return None for empty values.
+_PERSON_UPDATE_FIELDS = {
+    "first_name": None,
+    "surname": None,
+    "sex": None,
+    "birth_date": CDate.from_string,
+    "birth_place": Place.from_simple,
+    "birth_note": None,
+    "death_date": CDate.from_string,
+    "death_place": Place.from_simple,
+    "death_note": None,
+}
+
+
 @app.put("/api/person/{pid}")
 def api_update_person(pid: str, data: Dict[str, Any]):
     p = storage.get_person(pid)
     if p is None:
         raise HTTPException(status_code=404, detail="Person not found")
-    # update allowed fields
-    if "first_name" in data:
-        p.first_name = data.get("first_name")
-    if "surname" in data:
-        p.surname = data.get("surname")
-    if "sex" in data:
-        p.sex = data.get("sex")
-    if "birth_date" in data:
-        p.birth_date = CDate.from_string(data.get("birth_date")) if data.get("birth_date") else None
-    if "birth_place" in data:
-        p.birth_place = Place.from_simple(data.get("birth_place")) if data.get("birth_place") else None
-    if "birth_note" in data:
-        p.birth_note = data.get("birth_note")
-    if "death_date" in data:
-        p.death_date = CDate.from_string(data.get("death_date")) if data.get("death_date") else None
-    if "death_place" in data:
-        p.death_place = Place.from_simple(data.get("death_place")) if data.get("death_place") else None
-    if "death_note" in data:
-        p.death_note = data.get("death_note")
-    # pevents: replace list if provided
-    if "pevents" in data:
-        if data.get("pevents") is None:
-            p.pevents = []
-        else:
-            pe = []
-            for item in data.get("pevents"):
-                if isinstance(item, str):
-                    parts = [x.strip() for x in item.split("|")]
-                    kind = parts[0] if len(parts) > 0 else ""
-                    date = CDate.from_string(parts[1]) if len(parts) > 1 and parts[1] else None
-                    place = Place.from_simple(parts[2]) if len(parts) > 2 and parts[2] else None
-                    note = parts[3] if len(parts) > 3 and parts[3] else None
-                    pe.append(PersEvent(kind=kind, date=date, place=place, note=note))
-                elif isinstance(item, dict):
-                    pe.append(PersEvent.from_dict(item))
-            p.pevents = pe
-    storage.update_person(p)
+    with _in_place_edit():
+        # update allowed fields
+        for name, parse in _PERSON_UPDATE_FIELDS.items():
+            if name in data:
+                value = data[name]
+                setattr(p, name, parse(value) if parse else value)
+        # pevents: replace list if provided
+        if "pevents" in data:
+            if data.get("pevents") is None:
+                p.pevents = []
+            else:
+                pe = []
+                for item in data.get("pevents"):
+                    if isinstance(item, str):
+                        parts = [x.strip() for x in item.split("|")]
+                        kind = parts[0] if len(parts) > 0 else ""
+                        date = CDate.from_string(parts[1]) if len(parts) > 1 and parts[1] else None
+                        place = Place.from_simple(parts[2]) if len(parts) > 2 and parts[2] else None
+                        note = parts[3] if len(parts) > 3 and parts[3] else None
+                        pe.append(PersEvent(kind=kind, date=date, place=place, note=note))
+                    elif isinstance(item, dict):
+                        pe.append(PersEvent.from_dict(item))
+                p.pevents = pe
+        storage.update_person(p)
     return p.to_dict()
 
 
@@ -576,23 +618,24 @@ def edit_family(
     f = storage.get_family(fid)
     if f is None:
         raise HTTPException(status_code=404, detail="Family not found")
-    f.husband_id = husband_id or None
-    f.wife_id = wife_id or None
-    f.children_ids = children_ids
-    # parse fevents if provided (replace existing list)
-    fes: list[PersEvent] = []
-    for i, kind in enumerate(fevent_kind or []):
-        action = fevent_action[i] if i < len(fevent_action) else ""
-        if action == "remove":
-            continue
-        if not kind:
-            continue
-        date = CDate.from_string(fevent_date[i]) if i < len(fevent_date) and fevent_date[i] else None
-        place = Place.from_simple(fevent_place[i]) if i < len(fevent_place) and fevent_place[i] else None
-        note = fevent_note[i] if i < len(fevent_note) and fevent_note[i] else None
-        fes.append(PersEvent(kind=kind, date=date, place=place, note=note))
-    f.fevents = fes
-    storage.update_family(f)
+    with _in_place_edit():
+        f.husband_id = husband_id or None
+        f.wife_id = wife_id or None
+        f.children_ids = children_ids
+        # parse fevents if provided (replace existing list)
+        fes: list[PersEvent] = []
+        for i, kind in enumerate(fevent_kind or []):
+            action = fevent_action[i] if i < len(fevent_action) else ""
+            if action == "remove":
+                continue
+            if not kind:
+                continue
+            date = CDate.from_string(fevent_date[i]) if i < len(fevent_date) and fevent_date[i] else None
+            place = Place.from_simple(fevent_place[i]) if i < len(fevent_place) and fevent_place[i] else None
+            note = fevent_note[i] if i < len(fevent_note) and fevent_note[i] else None
+            fes.append(PersEvent(kind=kind, date=date, place=place, note=note))
+        f.fevents = fes
+        storage.update_family(f)
     return RedirectResponse(url=f"/family/{fid}", status_code=303)
 
 
@@ -606,54 +649,40 @@ def delete_family(fid: str):
 
 @app.get("/person/{pid}", response_class=HTMLResponse)
 def person_page(request: Request, pid: str):
-    logging.info("person_page requested for %s; persons: %s", pid, list(storage.persons.keys()))
+    logging.info("person_page requested for %s; persons_count: %d", pid, len(storage.persons))
     p = storage.get_person(pid)
     if p is None:
         raise HTTPException(status_code=404, detail="Person not found")
-    # collect related persons: spouses, parents, children using the index
-    spouses = []
-    parents = []
-    children = []
-    for fam in storage.families_of_person(pid):
+    # collect related persons: spouses, parents, children using the index.
+    # Keyed by id: dicts keep first-seen order and drop duplicates while
+    # collecting, so no separate de-duplication pass is needed.
+    spouses: Dict[str, Person] = {}
+    parents: Dict[str, Person] = {}
+    children: Dict[str, Person] = {}
+    # resolve the request's storage once, not through the proxy per lookup
+    get_person = storage.get_person
+    # the role indexes say which families pid is a spouse or a child in, so
+    # no family needs a membership test on its children list
+    for fam in storage.families_as_spouse(pid):
         # spouses: if pid is husband, include wife; if pid is wife, include husband
         if fam.husband_id == pid and fam.wife_id:
-            wp = storage.get_person(fam.wife_id)
+            wp = get_person(fam.wife_id)
             if wp:
-                spouses.append(wp)
+                spouses.setdefault(wp.id, wp)
         if fam.wife_id == pid and fam.husband_id:
-            hp = storage.get_person(fam.husband_id)
+            hp = get_person(fam.husband_id)
             if hp:
-                spouses.append(hp)
-        # parents: if pid is a child in this family, include parents
-        if pid in fam.children_ids:
-            if fam.husband_id:
-                pp = storage.get_person(fam.husband_id)
-                if pp:
-                    parents.append(pp)
-            if fam.wife_id:
-                pp = storage.get_person(fam.wife_id)
-                if pp:
-                    parents.append(pp)
-        # children: if pid is a spouse in this family, include children
-        if fam.husband_id == pid or fam.wife_id == pid:
-            for cid in fam.children_ids:
-                cp = storage.get_person(cid)
-                if cp:
-                    children.append(cp)
-
-    # unique by id while preserving order
-    def unique_persons(lst):
-        seen = set()
-        out = []
-        for x in lst:
-            if x.id not in seen:
-                seen.add(x.id)
-                out.append(x)
-        return out
-
-    spouses = unique_persons(spouses)
-    parents = unique_persons(parents)
-    children = unique_persons(children)
+                spouses.setdefault(hp.id, hp)
+        # children: pid is a spouse in this family
+        for cid in fam.children_ids:
+            cp = get_person(cid)
+            if cp:
+                children.setdefault(cp.id, cp)
+    # parents: the couple of each family pid is a child in
+    for fam in storage.families_as_child(pid):
+        for pp in storage.get_persons(fam.husband_id, fam.wife_id):
+            if pp:
+                parents.setdefault(pp.id, pp)
 
     # families the person belongs to (using index)
     families = list(storage.families_of_person(pid))
@@ -670,9 +699,9 @@ def person_page(request: Request, pid: str):
         {
             "request": request,
             "person": p,
-            "spouses": spouses,
-            "parents": parents,
-            "children": children,
+            "spouses": list(spouses.values()),
+            "parents": list(parents.values()),
+            "children": list(children.values()),
             "families": families,
         },
     )
@@ -684,9 +713,7 @@ def family_page(request: Request, fid: str):
     f = storage.get_family(fid)
     if f is None:
         raise HTTPException(status_code=404, detail="Family not found")
-    husband = storage.get_person(f.husband_id) if f.husband_id else None
-    wife = storage.get_person(f.wife_id) if f.wife_id else None
-    children = [storage.get_person(cid) for cid in f.children_ids]
+    husband, wife, *children = storage.get_persons(f.husband_id, f.wife_id, *f.children_ids)
     return localized_template_response(
         "family.html",
         {"request": request, "family": f, "husband": husband, "wife": wife, "children": children},
@@ -751,55 +778,43 @@ def api_person(pid: str):
     if p is None:
         raise HTTPException(status_code=404, detail="Person not found")
 
-    spouses = []
-    parents = []
-    children = []
+    # related persons keyed by id: duplicates are dropped while collecting,
+    # before any of them is converted with to_dict()
+    spouses: Dict[str, Person] = {}
+    parents: Dict[str, Person] = {}
+    children: Dict[str, Person] = {}
     families = []
+    # resolve the request's storage once, not through the proxy per lookup
+    get_person = storage.get_person
 
     for fam in storage.families_of_person(pid):
         families.append(fam.to_dict())
+    for fam in storage.families_as_spouse(pid):
         # spouses
         if fam.husband_id == pid and fam.wife_id:
-            wp = storage.get_person(fam.wife_id)
+            wp = get_person(fam.wife_id)
             if wp:
-                spouses.append(wp.to_dict())
+                spouses.setdefault(wp.id, wp)
         if fam.wife_id == pid and fam.husband_id:
-            hp = storage.get_person(fam.husband_id)
+            hp = get_person(fam.husband_id)
             if hp:
-                spouses.append(hp.to_dict())
-        # parents
-        if pid in fam.children_ids:
-            if fam.husband_id:
-                pp = storage.get_person(fam.husband_id)
-                if pp:
-                    parents.append(pp.to_dict())
-            if fam.wife_id:
-                pp = storage.get_person(fam.wife_id)
-                if pp:
-                    parents.append(pp.to_dict())
+                spouses.setdefault(hp.id, hp)
         # children
-        if fam.husband_id == pid or fam.wife_id == pid:
-            for cid in fam.children_ids:
-                cp = storage.get_person(cid)
-                if cp:
-                    children.append(cp.to_dict())
-
-    # deduplicate by id
-    def uniq_by_id(objs):
-        seen = set()
-        out = []
-        for o in objs:
-            oid = o.get("id")
-            if oid and oid not in seen:
-                seen.add(oid)
-                out.append(o)
-        return out
+        for cid in fam.children_ids:
+            cp = get_person(cid)
+            if cp:
+                children.setdefault(cp.id, cp)
+    # parents
+    for fam in storage.families_as_child(pid):
+        for pp in storage.get_persons(fam.husband_id, fam.wife_id):
+            if pp:
+                parents.setdefault(pp.id, pp)
 
     return {
         "person": p.to_dict(),
-        "spouses": uniq_by_id(spouses),
-        "parents": uniq_by_id(parents),
-        "children": uniq_by_id(children),
+        "spouses": [x.to_dict() for x in spouses.values()],
+        "parents": [x.to_dict() for x in parents.values()],
+        "children": [x.to_dict() for x in children.values()],
         "families": families,
     }
 
@@ -809,9 +824,8 @@ def api_family(fid: str):
     f = storage.get_family(fid)
     if f is None:
         raise HTTPException(status_code=404, detail="Family not found")
-    husband = storage.get_person(f.husband_id) if f.husband_id else None
-    wife = storage.get_person(f.wife_id) if f.wife_id else None
-    children = [storage.get_person(cid).to_dict() for cid in f.children_ids if storage.get_person(cid)]
+    husband, wife, *children = storage.get_persons(f.husband_id, f.wife_id, *f.children_ids)
+    children = [c.to_dict() for c in children if c]
     return {
         "family": f.to_dict(),
         "husband": husband.to_dict() if husband else None,
@@ -827,14 +841,26 @@ def api_search(q: str = None, type: str = "both", limit: int = 50):
         raise HTTPException(status_code=400, detail="Missing query parameter 'q'")
     res = {}
     if type in ("people", "both"):
-        ppl = search_people(list(storage.list_persons()), q, limit=limit)
+        # snapshot the values: other requests may add or delete persons while
+        # the search iterates (handlers run in the server's threadpool)
+        ppl = search_people(list(storage.persons.values()), q, limit=limit)
         res["people"] = [p.to_dict() for p in ppl]
     if type in ("families", "both"):
-        fams = search_families(list(storage.families.values()), list(storage.list_persons()), q, limit=limit)
+        # snapshot the families too; persons is only used for .get() lookups
+        fams = search_families(list(storage.families.values()), storage.persons, q, limit=limit)
         res["families"] = [f.to_dict() for f in fams]
     return res
 
 
+@app.get("/api/surname/{surname}")
+def api_surname(surname: str):
+    """Persons carrying exactly `surname` (case-insensitive), sorted by first name."""
+    # served from the storage's surname index, not a scan of every person
+    persons = storage.persons_by_surname(surname)
+    persons.sort(key=lambda p: ((p.first_name or "").casefold(), p.id))
+    return {"surname": surname, "persons": [p.to_dict() for p in persons]}
+
+
 @app.get("/search", response_class=HTMLResponse)
 def search_page(request: Request, q: Optional[str] = None, type: str = "both", limit: int = 50):
     """Render a simple search UI that shows people and family results using the
@@ -843,14 +869,15 @@ def search_page(request: Request, q: Optional[str] = None, type: str = "both", l
     families = []
     if q:
         if type in ("people", "both"):
-            people = search_people(list(storage.list_persons()), q, limit=limit)
+            # snapshot, as in api_search: concurrent writes may resize the dict
+            people = search_people(list(storage.persons.values()), q, limit=limit)
         if type in ("families", "both"):
             # compute a families display structure (avoid referencing `storage` from templates)
-            raw_fams = search_families(list(storage.families.values()), list(storage.list_persons()), q, limit=limit)
+            raw_fams = search_families(list(storage.families.values()), storage.persons, q, limit=limit)
             families = []
+            get_persons = storage.get_persons
             for f in raw_fams:
-                husband = storage.get_person(f.husband_id) if f.husband_id else None
-                wife = storage.get_person(f.wife_id) if f.wife_id else None
+                husband, wife = get_persons(f.husband_id, f.wife_id)
                 families.append({
                     "id": f.id,
                     "husband": husband.to_dict() if husband else None,
@@ -56,18 +56,17 @@ def main():
 
     print("Sosa ancestors for A:")
     anc = sosa_ancestors(store, A.id, max_depth=3)
-    # pretty print each ancestor with name and sosa
-    for e in anc:
-        pid = e["person_id"]
-        p = store.get_person(pid)
-        print(f"  {e['sosa']:>3}: {p.first_name} (id={pid[:8]})")
+    # pretty print each ancestor with name and sosa (one write for all rows)
+    print("\n".join(
+        f"  {e['sosa']:>3}: {store.get_person(e['person_id']).first_name} (id={e['person_id'][:8]})"
+        for e in anc
+    ))
 
     print("\nShortest path D -> G:")
     dist, path = shortest_path(store, D.id, G.id)
     print(f"  distance={dist}")
     print("  path:")
-    for pid in path:
-        print("   -", store.get_person(pid).first_name)
+    print("\n".join(f"   - {store.get_person(pid).first_name}" for pid in path))
 
     print("\nCoefficient of relationship A <-> B:")
     r, common = relationship_and_links(store, A.id, B.id, max_anc_depth=6)
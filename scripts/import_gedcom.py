@@ -13,39 +13,75 @@ import sys
 # ensure package importable when running from repo root
 ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(ROOT))
+# geneweb_py modules are imported only once a command has been parsed, so
+# `--help` and usage errors never pay for loading the storage layer.
 
-from geneweb_py.storage import Storage
-from geneweb_py.gedcom_adapter import import_gedcom, export_gedcom
 
+def _cmd_import(args):
+    from geneweb_py.storage import Storage
+    from geneweb_py.gedcom_adapter import import_gedcom
 
-def main(argv=None):
-    p = argparse.ArgumentParser(prog="import_gedcom")
-    sub = p.add_subparsers(dest="cmd", required=True)
+    ged = Path(args.file)
+    if not ged.exists():
+        print(f"GEDCOM file not found: {ged}")
+        return 2
+    storage = Storage(Path(args.data_dir))
+    mapping = import_gedcom(ged, storage)
+    print(f"Imported GEDCOM; created/mapped {len(mapping)} persons")
+    return 0
+
+
+def _cmd_export(args):
+    from geneweb_py.storage import Storage
+    from geneweb_py.gedcom_adapter import export_gedcom
+
+    out = Path(args.out)
+    try:
+        # export never writes to the base: open it read-only
+        storage = Storage(Path(args.data_dir), readonly=True)
+    except FileNotFoundError as e:
+        print(e)
+        return 2
+    export_gedcom(storage, out)
+    print(f"Exported GEDCOM to {out}")
+    return 0
+
+
+def _add_import_parser(sub):
     imp = sub.add_parser("import")
     imp.add_argument("--file", "-f", required=True, help="Path to GEDCOM file to import")
     imp.add_argument("--data-dir", default="data", help="Data dir (where storage.db lives or will be created)")
+    imp.set_defaults(func=_cmd_import)
+
+
+def _add_export_parser(sub):
     exp = sub.add_parser("export")
     exp.add_argument("--out", "-o", required=True, help="Output GEDCOM path")
     exp.add_argument("--data-dir", default="data", help="Data dir (where storage.db lives)")
+    exp.set_defaults(func=_cmd_export)
 
-    args = p.parse_args(argv)
 
-    data_dir = Path(args.data_dir)
-    storage = Storage(data_dir)
-
-    if args.cmd == "import":
-        ged = Path(args.file)
-        if not ged.exists():
-            print(f"GEDCOM file not found: {ged}")
-            return 2
-        mapping = import_gedcom(ged, storage)
-        print(f"Imported GEDCOM; created/mapped {len(mapping)} persons")
-        return 0
-    elif args.cmd == "export":
-        out = Path(args.out)
-        export_gedcom(storage, out)
-        print(f"Exported GEDCOM to {out}")
-        return 0
+# sub-command name -> function registering its sub-parser
+_SUBCOMMANDS = {
+    "import": _add_import_parser,
+    "export": _add_export_parser,
+}
+
+
+def main(argv=None):
+    if argv is None:
+        argv = sys.argv[1:]
+    p = argparse.ArgumentParser(prog="import_gedcom")
+    sub = p.add_subparsers(dest="cmd", required=True)
+    # Only build the sub-parser of the requested command; --help, a missing or
+    # an unknown command registers all of them so argparse can list choices.
+    cmd = argv[0] if argv else None
+    builders = [_SUBCOMMANDS[cmd]] if cmd in _SUBCOMMANDS else _SUBCOMMANDS.values()
+    for build in builders:
+        build(sub)
+
+    args = p.parse_args(argv)
+    return args.func(args)
 
 
 if __name__ == "__main__":
@@ -46,3 +46,16 @@ def test_request_binding_and_isolation(tmp_path):
 
     # After resetting token1 no storage should be bound
     assert storage_mod.get_current_storage() is None
+
+
+def test_storage_manager_concurrent_get_returns_one_instance(tmp_path):
+    from concurrent.futures import ThreadPoolExecutor
+
+    sm = storage_mod.StorageManager(tmp_path)
+    names = ["A", "B", "A", "B", "A", "B"]
+    with ThreadPoolExecutor(max_workers=len(names)) as ex:
+        got = list(ex.map(sm.get_storage, names))
+
+    assert all(s is got[0] for s in got[0::2])
+    assert all(s is got[1] for s in got[1::2])
+    assert got[0] is not got[1]
@@ -1,7 +1,7 @@
 import os
 from pathlib import Path
 
-from geneweb_py.gedcom_adapter import import_gedcom, export_gedcom
+from geneweb_py.gedcom_adapter import import_gedcom, export_gedcom, export_gedcom_to_string, _split_name
 from geneweb_py.storage import Storage
 from geneweb_py.models import Person, Family
 
@@ -67,3 +67,37 @@ def test_export_gedcom_writes_file_and_contains_names(tmp_path):
     # Check that names are present in the GEDCOM output
     assert "NAME John /Doe/" in txt
     assert "NAME Jane /Doe/" in txt
+
+
+def test_split_name_variants():
+    assert _split_name("John /Doe/") == ("John", "Doe")
+    assert _split_name("/Doe/") == ("", "Doe")
+    # empty slashes are skipped in favour of the next surname segment
+    assert _split_name("Ann //Lee/") == ("Ann /", "Lee")
+    # no closing slash: fall back to the last token
+    assert _split_name("Mary Ann /Smith") == ("Mary Ann", "/Smith")
+    assert _split_name("Plato") == ("Plato", "")
+    assert _split_name("") == ("", "")
+
+
+def test_export_gedcom_to_string_matches_file(tmp_path):
+    storage = Storage(tmp_path / "data")
+    p1 = Person(id="gedcom:I1", first_name="John", surname="Doe", sex="M")
+    storage.add_person(p1)
+    storage.add_family(Family(id="gedcom:F1", husband_id=p1.id, children_ids=[]))
+
+    out = tmp_path / "export.ged"
+    export_gedcom(storage, out)
+    txt = export_gedcom_to_string(storage)
+    assert txt == out.read_text(encoding="utf-8")
+    assert txt.startswith("0 HEAD\n")
+    assert txt.endswith("1 HUSB @gedcom:I1@\n0 TRLR")
+
+
+def test_import_gedcom_normalizes_sex_codes(tmp_path):
+    ged = tmp_path / "sex.ged"
+    ged.write_text("0 @I1@ INDI\n1 SEX m\n0 @I2@ INDI\n1 SEX F\n0 @I3@ INDI\n1 SEX U\n0 @I4@ INDI\n", encoding="utf-8")
+    storage = Storage(tmp_path / "data")
+    import_gedcom(ged, storage)
+    sexes = [storage.get_person(f"gedcom:I{i}").sex for i in range(1, 5)]
+    assert sexes == ["M", "F", "U", None]
@@ -12,6 +12,24 @@ def test_person_to_from_dict():
     assert p2.surname == "Smith"
 
 
+def test_person_from_dict_normalizes_dates_and_places():
+    bd = CDate(year=1900, month=1, day=2, precision="day")
+    p = Person.from_dict({
+        "id": "p1",
+        "birth_date": bd,
+        "birth_place": {"town": "Paris"},
+        "death_date": {"year": 1950},
+        "death_place": "not a place",
+    })
+    assert p.id == "p1"
+    assert p.birth_date is bd
+    assert p.birth_place.town == "Paris"
+    assert p.death_date.year == 1950
+    assert p.death_place is None
+    # a missing id still gets a fresh one
+    assert Person.from_dict({}).id
+
+
 def test_family_to_from_dict():
     f = Family(husband_id="h1", wife_id="w1", children_ids=["c1", "c2"])
     d = f.to_dict()
@@ -66,3 +84,23 @@ def test_cdate_fallback_year():
     assert cd is not None
     assert cd.year == 1875
     assert cd.precision == "unknown"
+
+
+@pytest.mark.parametrize(
+    "s",
+    [
+        "1900-05-03", "1900-05", "1900", "0900-01-01", "ABT 1900",
+        # short and long years, odd field widths: not to_iso() output
+        "99", "900", "12345", "12345-01-02", "1900-005", "1900-1-2",
+    ],
+)
+def test_cdate_from_iso_matches_from_string(s):
+    assert CDate.from_iso(s) == CDate.from_string(s)
+
+
+def test_cdate_from_string_returns_independent_objects():
+    a = CDate.from_string("12 JAN 1900")
+    a.year = 1800
+    b = CDate.from_string("12 JAN 1900")
+    assert b.year == 1900
+    assert a is not b
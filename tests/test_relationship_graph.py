@@ -53,3 +53,17 @@ def test_shortest_path_unrelated(tmp_path: Path):
     dist, path = shortest_path(store, a.id, b.id)
     assert dist is None
     assert path == []
+
+
+def test_all_shortest_paths_long_line(tmp_path: Path):
+    # a single ancestry line longer than the default recursion limit
+    store = Storage(tmp_path / "s")
+    people = [Person(first_name=str(i)) for i in range(1200)]
+    with store.batch():
+        for p in people:
+            store.add_person(p)
+        for parent, child in zip(people, people[1:]):
+            store.add_family(Family(husband_id=parent.id, children_ids=[child.id]))
+
+    paths = all_shortest_paths(store, people[0].id, people[-1].id)
+    assert paths == [[p.id for p in people]]
@@ -31,3 +31,6 @@ def test_search_families_basic(tmp_path):
     res = search_families(list(st.families.values()), list(st.list_persons()), "doe")
     assert len(res) == 1
     assert res[0].id == f.id
+    # the storage's id -> Person mapping is accepted directly
+    res = search_families(st.families.values(), st.persons, "smith")
+    assert [x.id for x in res] == [f.id]
@@ -81,3 +81,309 @@ def test_update_person_raises_on_missing(tmp_path):
     except KeyError:
         raised = True
     assert raised
+
+
+def test_added_rows_survive_reload(tmp_path):
+    st = Storage(tmp_path)
+    p1 = Person(first_name="A", surname="X")
+    p2 = Person(first_name="B", surname="Y")
+    st.add_person(p1)
+    st.add_person(p2)
+    f = Family(husband_id=p1.id, wife_id=p2.id, children_ids=[p2.id])
+    st.add_family(f)
+    st2 = Storage(tmp_path)
+    assert st2.get_person(p1.id).surname == "X"
+    assert st2.get_family(f.id).children_ids == [p2.id]
+
+
+def test_role_indexes_follow_family_changes(tmp_path):
+    st = Storage(tmp_path)
+    h = Person(first_name="H")
+    w = Person(first_name="W")
+    c = Person(first_name="C")
+    for p in (h, w, c):
+        st.add_person(p)
+    f = Family(husband_id=h.id, wife_id=w.id, children_ids=[c.id])
+    st.add_family(f)
+    assert [x.id for x in st.families_as_spouse(h.id)] == [f.id]
+    assert [x.id for x in st.families_as_child(c.id)] == [f.id]
+    assert list(st.families_as_child(h.id)) == []
+    st.delete_family(f.id)
+    assert list(st.families_as_spouse(w.id)) == []
+    assert list(st.families_as_child(c.id)) == []
+
+
+def test_update_family_in_place_drops_stale_index_entries(tmp_path):
+    st = Storage(tmp_path)
+    h = Person(first_name="H")
+    c = Person(first_name="C")
+    st.add_person(h)
+    st.add_person(c)
+    f = Family(husband_id=h.id, wife_id=None, children_ids=[c.id])
+    st.add_family(f)
+    # the app mutates the stored object before calling update_family
+    f.husband_id = None
+    f.children_ids = []
+    st.update_family(f)
+    assert list(st.families_of_person(h.id)) == []
+    assert list(st.families_as_child(c.id)) == []
+
+
+def test_batch_commits_once_on_exit(tmp_path):
+    st = Storage(tmp_path)
+    p1 = Person(first_name="A", surname="X")
+    p2 = Person(first_name="B", surname="Y")
+    with st.batch():
+        st.add_person(p1)
+        with st.batch():
+            st.add_person(p2)
+        # nothing is visible to another connection until the outer block exits
+        assert Storage(tmp_path).get_person(p1.id) is None
+    st2 = Storage(tmp_path)
+    assert st2.get_person(p1.id).surname == "X"
+    assert st2.get_person(p2.id).surname == "Y"
+
+
+def test_readonly_storage_reads_existing_base(tmp_path):
+    st = Storage(tmp_path)
+    p = Person(first_name="A", surname="X")
+    st.add_person(p)
+    ro = Storage(tmp_path, readonly=True)
+    assert ro.get_person(p.id).surname == "X"
+
+
+def test_readonly_storage_requires_existing_db(tmp_path):
+    try:
+        Storage(tmp_path / "missing", readonly=True)
+        raised = False
+    except FileNotFoundError:
+        raised = True
+    assert raised
+    assert not (tmp_path / "missing").exists()
+
+
+def test_get_persons_keeps_order_and_none_for_missing(tmp_path):
+    st = Storage(tmp_path)
+    a = Person(first_name="A")
+    b = Person(first_name="B")
+    st.add_person(a)
+    st.add_person(b)
+    assert st.get_persons(b.id, None, "nope", a.id) == [b, None, None, a]
+
+
+def test_updates_survive_reload(tmp_path):
+    st = Storage(tmp_path)
+    a = Person(first_name="A", surname="X")
+    b = Person(first_name="B", surname="Y")
+    st.add_person(a)
+    st.add_person(b)
+    f = Family(husband_id=a.id, children_ids=[b.id])
+    st.add_family(f)
+    a.surname = "Z"
+    st.update_person(a)
+    f.children_ids = []
+    f.wife_id = b.id
+    st.update_family(f)
+    st2 = Storage(tmp_path)
+    assert st2.get_person(a.id).surname == "Z"
+    assert st2.get_person(b.id).surname == "Y"
+    assert st2.get_family(f.id).children_ids == []
+    assert st2.get_family(f.id).wife_id == b.id
+
+
+def test_deletes_and_notes_survive_reload(tmp_path):
+    st = Storage(tmp_path)
+    h = Person(first_name="H")
+    c = Person(first_name="C")
+    st.add_person(h)
+    st.add_person(c)
+    f1 = Family(husband_id=h.id, children_ids=[c.id])
+    f2 = Family(husband_id=c.id)
+    st.add_family(f1)
+    st.add_family(f2)
+    st.delete_person(c.id)
+    st.delete_family(f2.id)
+    st.add_note(Note(id="n1", title="T", text="x"))
+    st.add_note(Note(id="n2", title="U", text="y"))
+    st.delete_note("n2")
+    st2 = Storage(tmp_path)
+    assert st2.get_person(c.id) is None
+    assert st2.get_family(f1.id).children_ids == []
+    assert st2.get_family(f2.id) is None
+    assert st2.get_note("n1").text == "x"
+    assert st2.get_note("n2") is None
+
+
+def test_batch_rolls_back_on_error(tmp_path):
+    st = Storage(tmp_path)
+    kept = Person(first_name="Kept")
+    st.add_person(kept)
+    lost = Person(first_name="Lost")
+    try:
+        with st.batch():
+            st.add_person(lost)
+            raise RuntimeError("boom")
+    except RuntimeError:
+        pass
+    st2 = Storage(tmp_path)
+    assert st2.get_person(kept.id) is not None
+    assert st2.get_person(lost.id) is None
+
+
+
+def test_failed_batch_restores_memory(tmp_path):
+    st = Storage(tmp_path)
+    a = Person(first_name="A", surname="Doe")
+    c = Person(first_name="C")
+    st.add_person(a)
+    st.add_person(c)
+    f = Family(husband_id=a.id, children_ids=[c.id])
+    st.add_family(f)
+    lost = Person(first_name="Lost")
+    version = st.version
+    try:
+        with st.batch():
+            st.delete_person(a.id)
+            st.add_person(lost)
+            raise RuntimeError("boom")
+    except RuntimeError:
+        pass
+    # memory agrees with the rolled back DB again
+    assert a.id in st.persons
+    assert lost.id not in st.persons
+    assert st.get_family(f.id).husband_id == a.id
+    assert [x.id for x in st.families_as_spouse(a.id)] == [f.id]
+    assert [x.id for x in st.families_as_child(c.id)] == [f.id]
+    assert [p.id for p in st.persons_by_surname("doe")] == [a.id]
+    assert st.version != version
+    st2 = Storage(tmp_path)
+    assert sorted(st2.persons) == sorted(st.persons)
+
+def test_children_order_survives_reload(tmp_path):
+    st = Storage(tmp_path)
+    kids = [Person(first_name=str(i)) for i in range(5)]
+    for k in kids:
+        st.add_person(k)
+    f1 = Family(children_ids=[k.id for k in reversed(kids)])
+    f2 = Family(children_ids=[kids[2].id, kids[0].id])
+    st.add_family(f1)
+    st.add_family(f2)
+    st2 = Storage(tmp_path)
+    assert st2.get_family(f1.id).children_ids == f1.children_ids
+    assert st2.get_family(f2.id).children_ids == f2.children_ids
+
+
+def test_file_backed_notes_after_reload(tmp_path):
+    st = Storage(tmp_path)
+    st.commit_note("n1", "T1", "body1")
+    # a note file added without going through the storage API
+    st.note_file_path("n3").write_text("body3", encoding="utf-8")
+    st.note_file_path("n1").write_text("edited", encoding="utf-8")
+    st2 = Storage(tmp_path)
+    assert st2.get_note("n1").text == "edited"
+    assert st2.get_note("n3").text == "body3"
+    assert sorted(n.id for n in st2.list_notes()) == ["n1", "n3"]
+    assert st2.delete_note("n3")
+    assert st2.get_note("n3") is None
+
+
+def test_persons_by_surname_follows_edits(tmp_path):
+    st = Storage(tmp_path)
+    a = Person(first_name="A", surname="Doe")
+    b = Person(first_name="B", surname="DOE")
+    c = Person(first_name="C", surname="Smith")
+    for p in (a, b, c):
+        st.add_person(p)
+    assert {p.id for p in st.persons_by_surname("doe")} == {a.id, b.id}
+    # edited in place, as the web app does
+    b.surname = "Smith"
+    st.update_person(b)
+    assert [p.id for p in st.persons_by_surname("Doe")] == [a.id]
+    st.delete_person(c.id)
+    assert [p.id for p in st.persons_by_surname("smith")] == [b.id]
+    st2 = Storage(tmp_path)
+    assert [p.id for p in st2.persons_by_surname("SMITH")] == [b.id]
+
+
+def test_bulk_add_indexes_and_persists(tmp_path):
+    st = Storage(tmp_path)
+    h = Person(first_name="H", surname="Doe")
+    c = Person(first_name="C", surname="Doe")
+    st.add_persons([h, c])
+    f = Family(husband_id=h.id, children_ids=[c.id])
+    st.add_families([f])
+    assert [x.id for x in st.families_as_child(c.id)] == [f.id]
+    assert len(st.persons_by_surname("doe")) == 2
+    st2 = Storage(tmp_path)
+    assert st2.get_family(f.id).children_ids == [c.id]
+    assert st2.get_person(h.id).surname == "Doe"
+
+
+def test_version_changes_on_every_mutation(tmp_path):
+    st = Storage(tmp_path)
+    seen = [st.version]
+    p = Person(first_name="A", surname="Doe")
+    st.add_person(p)
+    seen.append(st.version)
+    f = Family(husband_id=p.id)
+    st.add_family(f)
+    seen.append(st.version)
+    st.update_person(p)
+    seen.append(st.version)
+    st.delete_family(f.id)
+    seen.append(st.version)
+    st.add_note(Note(id="n1", title="t", text="x"))
+    seen.append(st.version)
+    assert len(set(seen)) == len(seen)
+    # a storage reopened on the same root never reuses a version
+    assert Storage(tmp_path).version not in seen
+
+
+def test_readding_family_id_replaces_index_entries(tmp_path):
+    st = Storage(tmp_path)
+    a = Person(first_name="A")
+    b = Person(first_name="B")
+    c = Person(first_name="C")
+    st.add_persons([a, b, c])
+    st.add_family(Family(id="F", husband_id=a.id, children_ids=[c.id]))
+    st.add_family(Family(id="F", husband_id=b.id))
+    assert list(st.families_as_spouse(a.id)) == []
+    assert list(st.families_as_child(c.id)) == []
+    assert list(st.families_of_person(c.id)) == []
+    assert [f.id for f in st.families_as_spouse(b.id)] == ["F"]
+
+
+def test_json_columns_round_trip_big_ints_and_nan(tmp_path):
+    import math
+
+    st = Storage(tmp_path)
+    p = Person.from_dict({
+        "first_name": "A",
+        "surname": "Doe",
+        "pevents": [
+            {"kind": "x", "date": {"year": 10**30}},
+            {"kind": "y", "date": {"year": float("nan")}},
+        ],
+    })
+    st.add_person(p)
+    assert p.id in st.persons
+    st2 = Storage(tmp_path)
+    big, nan = st2.get_person(p.id).pevents
+    assert big.date.year == 10**30
+    assert isinstance(big.date.year, int)
+    assert math.isnan(nan.date.year)
+
+
+def test_overlapping_loads_restore_gc():
+    import gc
+    from geneweb_py.storage import _gc_paused
+
+    assert gc.isenabled()
+    first, second = _gc_paused(), _gc_paused()
+    first.__enter__()
+    second.__enter__()
+    # the first load finishes while the second is still running
+    first.__exit__(None, None, None)
+    assert not gc.isenabled()
+    second.__exit__(None, None, None)
+    assert gc.isenabled()
@@ -22,3 +22,92 @@ def test_routes_include_plugin_and_root():
     assert "/" in paths
     # plugin route should be present
     assert "/hello-plugin" in paths
+
+
+def test_families_list_label_follows_parent_edit(tmp_path):
+    from starlette.requests import Request
+    from geneweb_py import storage as storage_mod
+    from geneweb_py.models import Person, Family
+    from geneweb_py.web.app import families_list
+
+    st = storage_mod.Storage(tmp_path)
+    h = Person(first_name="H", surname="Doe")
+    w = Person(first_name="W", surname="Roe")
+    st.add_person(h)
+    st.add_person(w)
+    st.add_family(Family(husband_id=h.id, wife_id=w.id))
+
+    request = Request({"type": "http", "method": "GET", "path": "/families", "query_string": b"", "headers": [], "app": app})
+    token = storage_mod.bind_current_storage(st)
+    try:
+        first = families_list(request).body.decode("utf-8")
+        assert "Doe and Roe" in first
+        # rendered again without changes: same page from the cached rows
+        assert families_list(request).body.decode("utf-8") == first
+        h.surname = "Zed"
+        st.update_person(h)
+        page = families_list(request).body.decode("utf-8")
+    finally:
+        storage_mod.CURRENT_STORAGE.reset(token)
+    assert "Zed and Roe" in page
+    assert "Doe and Roe" not in page
+
+
+def test_api_surname_uses_index_and_follows_edits(tmp_path):
+    from geneweb_py import storage as storage_mod
+    from geneweb_py.models import Person
+    from geneweb_py.web.app import api_surname
+
+    st = storage_mod.Storage(tmp_path)
+    b = Person(first_name="Bob", surname="DOE")
+    a = Person(first_name="alice", surname="Doe")
+    c = Person(first_name="Carl", surname="Doeson")
+    for p in (b, a, c):
+        st.add_person(p)
+
+    token = storage_mod.bind_current_storage(st)
+    try:
+        res = api_surname("doe")
+        assert [p["id"] for p in res["persons"]] == [a.id, b.id]
+        b.surname = "Roe"
+        st.update_person(b)
+        assert [p["id"] for p in api_surname("DOE")["persons"]] == [a.id]
+        assert api_surname("nobody")["persons"] == []
+    finally:
+        storage_mod.CURRENT_STORAGE.reset(token)
+
+
+def test_default_json_response_renders_big_ints():
+    import json
+    from geneweb_py.web.app import _DefaultJSONResponse
+
+    body = _DefaultJSONResponse({"year": 10**30, "name": "é"}).body
+    assert json.loads(body) == {"year": 10**30, "name": "é"}
+
+
+def test_families_list_not_stale_after_failed_edit(tmp_path):
+    import pytest
+    from starlette.requests import Request
+    from geneweb_py import storage as storage_mod
+    from geneweb_py.models import Person, Family
+    from geneweb_py.web.app import families_list, api_update_person
+
+    st = storage_mod.Storage(tmp_path)
+    h = Person(first_name="H", surname="Doe")
+    w = Person(first_name="W", surname="Roe")
+    st.add_person(h)
+    st.add_person(w)
+    st.add_family(Family(husband_id=h.id, wife_id=w.id))
+
+    request = Request({"type": "http", "method": "GET", "path": "/families", "query_string": b"", "headers": [], "app": app})
+    token = storage_mod.bind_current_storage(st)
+    try:
+        assert "Doe and Roe" in families_list(request).body.decode("utf-8")
+        # the surname is set in place, then the events payload is rejected
+        # before anything is written
+        with pytest.raises(TypeError):
+            api_update_person(h.id, {"surname": "Zed", "pevents": 5})
+        page = families_list(request).body.decode("utf-8")
+    finally:
+        storage_mod.CURRENT_STORAGE.reset(token)
+    assert "Zed and Roe" in page